@@ -0,0 +1,358 @@
+import fnmatch
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+try:
+    import internetarchive as ia
+except ImportError:
+    # Callers fall back to shelling out to the 'ia' CLI when the library isn't importable.
+    ia = None
+
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+# Bytes per read when streaming a download to disk.
+DOWNLOAD_CHUNK = 1 << 20
+
+# Only these fields are used from search hits; asking for just them keeps responses small.
+SEARCH_FIELDS = ("identifier", "title", "year")
+
+# JSON-lines records parsed per json_loads call (see iter_ndjson).
+NDJSON_BATCH = 64
+
+# On-disk metadata cache, so re-opening the same item skips the network round-trip.
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "ia-minotaur", "metadata")
+CACHE_TTL = 3600
+
+# archive.org identifier charset. Identifiers come from user input and batch files and end up
+# in cache and download paths, so anything else (a "/", a leading ".") is refused.
+_IDENTIFIER_RX = re.compile(r"[A-Za-z0-9_-][A-Za-z0-9._-]*")
+
+_session = None
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@dataclass(slots=True)
+class SearchResult:
+    identifier: str
+    title: str
+    year: str
+
+
+@dataclass(slots=True)
+class IAFile:
+    name: str
+    size: int
+    fmt: str
+    name_lower: str = field(init=False, repr=False)
+    ext: str = field(init=False, repr=False)
+    haystack: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Derived once here so filters never re-lowercase or re-split names.
+        self.name_lower = self.name.lower()
+        self.ext = os.path.splitext(self.name_lower)[1]
+        # Name and format in one string (NUL-separated so a keyword can't span both).
+        self.haystack = self.name_lower + "\x00" + (self.fmt or "").lower()
+
+
+def human_size(n: int) -> str:
+    try:
+        n = int(n)
+    except Exception:
+        return "?"
+    # Unit index straight from the bit length (each unit is 10 bits), no division loop.
+    i = min((n.bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if n >= 1024 else 0
+    if i == 0:
+        return f"{n}{SIZE_UNITS[0]}"
+    return f"{n / (1 << (10 * i)):.2f}{SIZE_UNITS[i]}"
+
+
+def run_lines(cmd: List[str]) -> Iterator[bytes]:
+    # Yields raw stdout lines as they arrive instead of buffering the whole output.
+    # Lines stay as bytes; json_loads accepts them without a decode step.
+    try:
+        p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        raise RuntimeError(f"'{cmd[0]}' command not found. Install it with: pip3 install --user internetarchive")
+    with p:
+        for line in p.stdout:
+            yield line
+        err = p.stderr.read().decode("utf-8", "replace").strip()
+    if p.returncode:
+        raise RuntimeError(err or f"{' '.join(cmd[:2])} failed (code {p.returncode})")
+
+
+def get_session():
+    # One ArchiveSession (a pooled requests.Session) for the whole run, so
+    # search/metadata/download calls reuse TLS connections to archive.org.
+    global _session
+    if _session is None and ia is not None:
+        _session = ia.get_session(
+            http_adapter_kwargs={"pool_connections": HTTP_POOL_CONNECTIONS, "pool_maxsize": HTTP_POOL_MAXSIZE}
+        )
+    return _session
+
+
+def _parse_ndjson_batch(batch: List[bytes]) -> List[Any]:
+    try:
+        return json_loads(b"[" + b",".join(batch) + b"]")
+    except ValueError:
+        # Some line is malformed: parse one by one and drop only the bad ones.
+        out = []
+        for line in batch:
+            try:
+                out.append(json_loads(line))
+            except ValueError:
+                continue
+        return out
+
+
+def iter_ndjson(lines: Iterable[bytes]) -> Iterator[Any]:
+    # Parse JSON-lines a batch at a time, as one "[l1,l2,...]" array per json_loads call,
+    # instead of paying call overhead per line. Still streams at batch granularity.
+    batch: List[bytes] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        batch.append(line)
+        if len(batch) >= NDJSON_BATCH:
+            yield from _parse_ndjson_batch(batch)
+            batch = []
+    if batch:
+        yield from _parse_ndjson_batch(batch)
+
+
+def search_result(obj: Dict[str, Any]) -> Optional[SearchResult]:
+    identifier = str(obj.get("identifier", "")).strip()
+    if not identifier:
+        return None
+    title = str(obj.get("title", "")).strip() or "(no title)"
+    year = str(obj.get("year", "")).strip()
+    return SearchResult(identifier=identifier, title=title, year=year)
+
+
+def ia_search_cli(query: str, rows: int) -> Iterator[SearchResult]:
+    # ia CLI search with JSON output for robust parsing.
+    cmd = ["ia", "search", query, "--rows", str(rows), "--json"]
+    for name in SEARCH_FIELDS:
+        cmd += ["--field", name]
+    for obj in iter_ndjson(run_lines(cmd)):
+        r = search_result(obj)
+        if r:
+            yield r
+
+
+def search_items(query: str, rows: int) -> Iterator[SearchResult]:
+    # First page of results, yielded as they are parsed so callers can print while the rest
+    # arrive. Errors propagate; each tool reports them its own way.
+    if ia is None:
+        yield from ia_search_cli(query, rows)
+        return
+    for obj in ia.search_items(query, fields=SEARCH_FIELDS, params={"rows": rows, "page": 1}, archive_session=get_session()):
+        r = search_result(obj)
+        if r:
+            yield r
+
+
+def match_glob(name: str, pattern: str) -> bool:
+    # Same matching as `ia download --glob`: "|" separates alternative patterns.
+    return any(fnmatch.fnmatch(name, p) for p in pattern.split("|"))
+
+
+def check_identifier(identifier: str) -> str:
+    if not _IDENTIFIER_RX.fullmatch(identifier):
+        raise ValueError(f"invalid archive.org identifier: {identifier!r}")
+    return identifier
+
+
+def _cache_path(identifier: str) -> str:
+    return os.path.join(CACHE_DIR, f"{check_identifier(identifier)}.json")
+
+
+def read_cached_metadata(identifier: str, max_age: Optional[float] = CACHE_TTL) -> Optional[Dict[str, Any]]:
+    # max_age=None returns the entry however old it is (for revalidation).
+    path = _cache_path(identifier)
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) >= max_age:
+            return None
+        with open(path, "rb") as f:
+            meta = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def read_cache_validators(identifier: str) -> Dict[str, str]:
+    # ETag / Last-Modified saved next to the cached JSON, for conditional re-fetches.
+    try:
+        with open(_cache_path(identifier) + ".meta", "rb") as f:
+            v = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return v if isinstance(v, dict) else {}
+
+
+def _write_json_atomic(path: str, obj: Any) -> None:
+    # A fresh temp file per write: concurrent writers of one identifier never share it.
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            json.dump(obj, f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_cached_metadata(identifier: str, meta: Dict[str, Any], validators: Optional[Dict[str, str]] = None) -> None:
+    path = _cache_path(identifier)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write_json_atomic(path, meta)
+        if validators:
+            _write_json_atomic(path + ".meta", validators)
+    except OSError:
+        pass
+
+
+def parse_files(meta: Dict[str, Any]) -> List[IAFile]:
+    files = []
+    for f in meta.get("files", []) or []:
+        name = str(f.get("name", "")).strip()
+        if not name:
+            continue
+        size_raw = f.get("size")
+        try:
+            size = int(size_raw) if size_raw is not None else 0
+        except (TypeError, ValueError):
+            size = 0
+        fmt = str(f.get("format", "")).strip()
+        files.append(IAFile(name=name, size=size, fmt=fmt))
+    return files
+
+
+def fetch_metadata_cli(identifier: str) -> Dict[str, Any]:
+    # ia metadata ITEM --json gives a JSON blob with files.
+    try:
+        p = subprocess.run(
+            ["ia", "metadata", identifier, "--json"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError("'ia' command not found. Install it with: pip3 install --user internetarchive")
+    except subprocess.CalledProcessError as e:
+        msg = (e.stderr or b"").decode("utf-8", "replace").strip()
+        raise RuntimeError(msg or f"ia metadata failed (code {e.returncode})")
+    return json_loads(p.stdout)
+
+
+def fetch_metadata_http(identifier: str) -> Dict[str, Any]:
+    # GET the Metadata API directly (what get_item() does) so response headers are
+    # visible: a stale cache entry is revalidated with If-None-Match/If-Modified-Since,
+    # and a 304 just refreshes its mtime instead of re-downloading the JSON.
+    session = get_session()
+    headers: Dict[str, str] = {}
+    stale = read_cached_metadata(identifier, max_age=None)
+    if stale is not None:
+        v = read_cache_validators(identifier)
+        if v.get("etag"):
+            headers["If-None-Match"] = v["etag"]
+        if v.get("last_modified"):
+            headers["If-Modified-Since"] = v["last_modified"]
+    auth = None
+    if session.access_key and session.secret_key:
+        auth = ia.auth.S3Auth(session.access_key, session.secret_key)
+
+    r = session.get(f"https://archive.org/metadata/{identifier}", headers=headers, auth=auth, timeout=12)
+    if r.status_code == 304 and stale is not None:
+        try:
+            os.utime(_cache_path(identifier))
+        except OSError:
+            pass
+        return stale
+    r.raise_for_status()
+    meta = json_loads(r.content)
+    if meta:
+        write_cached_metadata(
+            identifier,
+            meta,
+            {"etag": r.headers.get("ETag", ""), "last_modified": r.headers.get("Last-Modified", "")},
+        )
+    return meta
+
+
+def fetch_metadata(identifier: str) -> Dict[str, Any]:
+    check_identifier(identifier)
+    meta = read_cached_metadata(identifier)
+    if meta is not None:
+        return meta
+    if ia is None:
+        meta = fetch_metadata_cli(identifier)
+        if meta:
+            write_cached_metadata(identifier, meta)
+        return meta
+    return fetch_metadata_http(identifier)
+
+
+@lru_cache(maxsize=256)
+def get_files(identifier: str) -> Tuple[IAFile, ...]:
+    # Parsed once per identifier per process; a tuple so the cached value can't be mutated.
+    return tuple(parse_files(fetch_metadata(identifier)))
+
+
+def fetch_to_disk(identifier: str, filename: str, dest: str, size: int = 0) -> str:
+    # size: the metadata size; a file already on disk at that size is kept, as ia download does.
+    item_dir = os.path.normpath(os.path.join(dest, check_identifier(identifier)))
+    path = os.path.normpath(os.path.join(item_dir, filename))
+    # File names may hold subfolders, but must not climb out of (or replace) the item folder.
+    if not path.startswith(item_dir + os.sep):
+        raise ValueError(f"file name escapes the download folder: {filename!r}")
+    if size > 0:
+        try:
+            if os.path.getsize(path) == size:
+                return path
+        except OSError:
+            pass
+    url = f"https://archive.org/download/{identifier}/{quote(filename)}"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Written under a .part name and renamed once complete, so a failed or interrupted
+    # transfer never leaves a truncated file at the final path.
+    part = path + ".part"
+    try:
+        with get_session().get(url, stream=True, timeout=60) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True
+            # Unbuffered file + 1 MiB reads: one write syscall per chunk, few Python iterations.
+            with open(part, "wb", buffering=0) as out:
+                shutil.copyfileobj(r.raw, out, length=DOWNLOAD_CHUNK)
+        os.replace(part, path)
+    except BaseException:
+        try:
+            os.unlink(part)
+        except OSError:
+            pass
+        raise
+    return path
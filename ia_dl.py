@@ -1,24 +1,20 @@
 #!/usr/bin/env python3
 import argparse
-import json
 import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from typing import Dict, Iterable, Iterator, List, Optional
 
-@dataclass
-class SearchResult:
-    identifier: str
-    title: str
-    year: str
+from ia_common import IAFile, SearchResult, fetch_to_disk, get_files, get_session, human_size, ia, match_glob, search_items
 
-@dataclass
-class IAFile:
-    name: str
-    size: int
-    format: str
+# Parallel file downloads per item; kept small to stay clear of archive.org rate limits.
+DOWNLOAD_WORKERS = 4
+
+# Metadata for the top search hits is fetched in the background while the user picks.
+PREFETCH_TOP_N = 5
+PREFETCH_WORKERS = 4
 
 def run(cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
     try:
@@ -33,98 +29,60 @@ def run(cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
             print(msg, file=sys.stderr)
         sys.exit(e.returncode)
 
-def human_size(n: int) -> str:
-    if n is None:
-        return "?"
-    n = int(n)
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    f = float(n)
-    while f >= 1024 and i < len(units) - 1:
-        f /= 1024.0
-        i += 1
-    if i == 0:
-        return f"{int(f)}{units[i]}"
-    return f"{f:.2f}{units[i]}"
-
 def sanitize_query(q: str) -> str:
     q = q.strip()
     q = re.sub(r"\s+", " ", q)
     return q
 
-def ia_search(query: str, rows: int) -> List[SearchResult]:
-    # Use ia CLI search and JSON output for robust parsing.
+def ia_search(query: str, rows: int) -> Iterator[SearchResult]:
     # Query example: title:"Test Copy" AND mediatype:movies
-    cmd = ["ia", "search", query, "--rows", str(rows), "--json"]
-    p = run(cmd)
-    results = []
-    for line in p.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        identifier = str(obj.get("identifier", "")).strip()
-        title = str(obj.get("title", "")).strip()
-        year = str(obj.get("year", "")).strip()
-        if identifier:
-            results.append(SearchResult(identifier=identifier, title=title or "(no title)", year=year or ""))
-    return results
-
-def choose_result(results: List[SearchResult]) -> Optional[SearchResult]:
-    if not results:
-        return None
+    # Results are yielded as they are parsed so callers can print while the rest arrive.
+    try:
+        yield from search_items(query, rows)
+    except Exception as e:
+        print(f"Search failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+def choose_result(results: Iterable[SearchResult]) -> Optional[SearchResult]:
+    shown: List[SearchResult] = []
     for i, r in enumerate(results, start=1):
         y = f" ({r.year})" if r.year else ""
         print(f"{i:2d}. {r.identifier}  |  {r.title}{y}")
+        shown.append(r)
+    if not shown:
+        print("No search results.")
+        return None
     while True:
         s = input("Pick a number (or blank to cancel): ").strip()
         if s == "":
+            print("Canceled.")
             return None
         if s.isdigit():
             idx = int(s)
-            if 1 <= idx <= len(results):
-                return results[idx - 1]
+            if 1 <= idx <= len(shown):
+                return shown[idx - 1]
         print("Invalid selection.")
 
 def ia_list_files(identifier: str) -> List[IAFile]:
-    # ia metadata ITEM --json gives a JSON blob with files.
-    cmd = ["ia", "metadata", identifier, "--json"]
-    p = run(cmd)
     try:
-        meta = json.loads(p.stdout)
-    except json.JSONDecodeError:
-        print("Could not parse metadata JSON.", file=sys.stderr)
+        return list(get_files(identifier))
+    except Exception as e:
+        print(f"Could not fetch metadata: {e}", file=sys.stderr)
         sys.exit(1)
 
-    files = []
-    for f in meta.get("files", []) or []:
-        name = str(f.get("name", "")).strip()
-        if not name:
-            continue
-        size_raw = f.get("size")
-        try:
-            size = int(size_raw) if size_raw is not None else 0
-        except (TypeError, ValueError):
-            size = 0
-        fmt = str(f.get("format", "")).strip()
-        files.append(IAFile(name=name, size=size, format=fmt))
-    return files
+def prefetch_metadata(results: Iterable[SearchResult], ex: ThreadPoolExecutor, futures: Dict[str, Future]) -> Iterator[SearchResult]:
+    # Pass results through unchanged, warming get_files for the first few
+    # in the background while the user is still reading the list.
+    for r in results:
+        if len(futures) < PREFETCH_TOP_N and r.identifier not in futures:
+            futures[r.identifier] = ex.submit(get_files, r.identifier)
+        yield r
 
 def filter_files(files: List[IAFile], exts: Optional[List[str]], regex: Optional[str]) -> List[IAFile]:
-    out = files[:]
+    out = files
     if exts:
-        norm_exts = []
-        for e in exts:
-            e = e.strip().lower()
-            if not e:
-                continue
-            if not e.startswith("."):
-                e = "." + e
-            norm_exts.append(e)
-        out = [f for f in out if os.path.splitext(f.name.lower())[1] in norm_exts]
+        norm_exts = frozenset("." + e.strip().lstrip(".").lower() for e in exts if e.strip().lstrip("."))
+        out = [f for f in out if f.ext in norm_exts]
     if regex:
         try:
             rx = re.compile(regex, re.IGNORECASE)
@@ -139,7 +97,7 @@ def print_files(files: List[IAFile]) -> None:
         print("(no matching files)")
         return
     for i, f in enumerate(files, start=1):
-        fmt = f.format if f.format else ""
+        fmt = f.fmt if f.fmt else ""
         print(f"{i:2d}. {human_size(f.size):>10}  {fmt:<20}  {f.name}")
 
 def choose_file(files: List[IAFile]) -> Optional[IAFile]:
@@ -158,11 +116,44 @@ def choose_file(files: List[IAFile]) -> Optional[IAFile]:
 def biggest_file(files: List[IAFile]) -> Optional[IAFile]:
     if not files:
         return None
-    return sorted(files, key=lambda f: f.size or 0, reverse=True)[0]
+    return max(files, key=lambda f: f.size or 0)
 
 def ia_download(identifier: str, dest: str, glob_pat: Optional[str], exact_file: Optional[str]) -> None:
     os.makedirs(dest, exist_ok=True)
 
+    if ia is None:
+        ia_download_cli(identifier, dest, glob_pat, exact_file)
+        return
+
+    listed = ia_list_files(identifier)
+    if exact_file:
+        # Sizes come from the listing, so a complete copy already on disk is skipped.
+        files = [f for f in listed if f.name == exact_file] or [IAFile(name=exact_file, size=0, fmt="")]
+    elif glob_pat:
+        files = [f for f in listed if match_glob(f.name, glob_pat)]
+    else:
+        files = listed
+    if not files:
+        print("No matching files to download.")
+        return
+
+    print(f"Downloading {len(files)} file(s) from {identifier} to {dest}")
+    failed = 0
+    with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(files))) as ex:
+        futures = {ex.submit(fetch_to_disk, identifier, f.name, dest, f.size): f.name for f in files}
+        for fut in as_completed(futures):
+            name = futures[fut]
+            try:
+                print(f"  saved {fut.result()}")
+            except Exception as e:
+                print(f"  failed {name}: {e}", file=sys.stderr)
+                failed += 1
+    if failed:
+        print(f"{failed} of {len(files)} file(s) failed.", file=sys.stderr)
+        sys.exit(1)
+    print("Done.")
+
+def ia_download_cli(identifier: str, dest: str, glob_pat: Optional[str], exact_file: Optional[str]) -> None:
     cmd = ["ia", "download", identifier, "--destdir", dest]
     if exact_file:
         cmd += ["--files", exact_file]
@@ -176,7 +167,7 @@ def ia_download(identifier: str, dest: str, glob_pat: Optional[str], exact_file:
 def main() -> int:
     ap = argparse.ArgumentParser(
         prog="ia_dl",
-        description="Helper CLI for searching and downloading from Internet Archive using the 'ia' tool."
+        description="Helper CLI for searching and downloading from Internet Archive (internetarchive library, or the 'ia' tool)."
     )
     sub = ap.add_subparsers(dest="cmd", required=True)
 
@@ -201,16 +192,18 @@ def main() -> int:
     dp.add_argument("--file", help="Download one exact file by name (advanced).")
 
     args = ap.parse_args()
+    get_session()
 
     if args.cmd == "search":
         q = sanitize_query(args.query)
-        results = ia_search(q, args.rows)
-        if not results:
-            print("No results.")
-            return 1
-        for r in results:
+        found = 0
+        for r in ia_search(q, args.rows):
             y = f" ({r.year})" if r.year else ""
             print(f"{r.identifier}\t{r.title}{y}")
+            found += 1
+        if not found:
+            print("No results.")
+            return 1
         return 0
 
     if args.cmd == "list":
@@ -224,15 +217,18 @@ def main() -> int:
 
         if args.search:
             q = sanitize_query(args.search)
-            results = ia_search(q, args.rows)
-            if not results:
-                print("No search results.")
-                return 1
-            chosen = choose_result(results)
-            if not chosen:
-                print("Canceled.")
-                return 1
-            identifier = chosen.identifier
+            prefetch: Dict[str, Future] = {}
+            ex = ThreadPoolExecutor(max_workers=PREFETCH_WORKERS)
+            try:
+                chosen = choose_result(prefetch_metadata(ia_search(q, args.rows), ex, prefetch))
+                if not chosen:
+                    return 1
+                identifier = chosen.identifier
+                # Let an in-flight fetch for the pick finish so ia_list_files hits the cache.
+                if identifier in prefetch:
+                    wait([prefetch[identifier]])
+            finally:
+                ex.shutdown(wait=False, cancel_futures=True)
 
         if not identifier:
             print("Error: provide an identifier or use --search.", file=sys.stderr)
@@ -1,28 +1,28 @@
 #!/usr/bin/env python3
-import json
+import argparse
 import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
 
-@dataclass
-class SearchResult:
-    identifier: str
-    title: str
-    year: str
+from ia_common import IAFile, SearchResult, fetch_to_disk, get_files, get_session, human_size, ia, match_glob, search_items
 
-@dataclass
-class IAFile:
-    name: str
-    size: int
-    fmt: str
+try:
+    import readline
+except ImportError:
+    # No line editing (e.g. Windows); prompts still accept numbers and typed names.
+    readline = None
+
+# Concurrent metadata lookups + file downloads in --batch mode.
+BATCH_WORKERS = 4
 
 VIDEO_EXTS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".m4v"}
 VIDEO_FORMAT_HINTS = (
     "h.264", "h264", "mpeg4", "mp4", "matroska", "webm", "quicktime", "avi"
 )
+_VIDEO_FMT_RE = re.compile("|".join(map(re.escape, VIDEO_FORMAT_HINTS)), re.IGNORECASE)
 
 def run(cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
     try:
@@ -39,136 +39,215 @@ def run(cmd: List[str], check: bool = True) -> subprocess.CompletedProcess:
             print("\n" + msg + "\n")
         sys.exit(e.returncode)
 
-def human_size(n: int) -> str:
-    try:
-        n = int(n)
-    except Exception:
-        return "?"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    f = float(n)
-    i = 0
-    while f >= 1024.0 and i < len(units) - 1:
-        f /= 1024.0
-        i += 1
-    if i == 0:
-        return f"{int(f)}{units[i]}"
-    return f"{f:.2f}{units[i]}"
-
 def prompt(msg: str) -> str:
     return input(msg).strip()
 
-def prompt_int(msg: str, lo: int, hi: int) -> Optional[int]:
-    while True:
-        s = prompt(msg)
-        if s == "":
-            return None
-        if s.isdigit():
-            v = int(s)
-            if lo <= v <= hi:
-                return v
-        print(f"Enter a number {lo}-{hi}, or press Enter to cancel.")
-
-def ia_search_simple(q: str, rows: int = 20) -> List[SearchResult]:
+def set_completions(names: Optional[List[str]]) -> None:
+    # Tab-complete against names (e.g. file names) at the next prompt; None turns it off.
+    if readline is None:
+        return
+    if not names:
+        readline.set_completer(None)
+        return
+    matches: List[str] = []
+
+    def complete(text: str, state: int) -> Optional[str]:
+        if state == 0:
+            matches[:] = [n for n in names if n.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(complete)
+    readline.set_completer_delims("")
+    readline.parse_and_bind("tab: complete")
+
+def prompt_int(msg: str, lo: int, hi: int, names: Optional[List[str]] = None) -> Optional[int]:
+    # names[i] is accepted in place of the number lo + i, with Tab completion.
+    set_completions(names)
+    try:
+        while True:
+            s = prompt(msg)
+            if s == "":
+                return None
+            if s.isdigit():
+                v = int(s)
+                if lo <= v <= hi:
+                    return v
+            if names and s in names:
+                return lo + names.index(s)
+            if names:
+                print(f"Enter a number {lo}-{hi} or a name (Tab completes), or press Enter to cancel.")
+            else:
+                print(f"Enter a number {lo}-{hi}, or press Enter to cancel.")
+    finally:
+        set_completions(None)
+
+def ia_search_simple(q: str, rows: int = 20) -> Iterator[SearchResult]:
     # If user types just words, we'll search those in title and restrict to movies.
     # You can still type full IA query syntax if you want.
     q = q.strip()
     if not q:
-        return []
+        return
 
     if ("mediatype:" not in q) and ("title:" not in q) and ("AND" not in q) and ("OR" not in q):
         query = f'title:("{q}") AND mediatype:movies'
     else:
         query = q
 
-    p = run(["ia", "search", query, "--rows", str(rows), "--json"])
-    out: List[SearchResult] = []
-    for line in p.stdout.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        ident = str(obj.get("identifier", "")).strip()
-        title = str(obj.get("title", "")).strip() or "(no title)"
-        year = str(obj.get("year", "")).strip()
-        if ident:
-            out.append(SearchResult(identifier=ident, title=title, year=year))
-    return out
+    try:
+        yield from search_items(query, rows)
+    except Exception as e:
+        print(f"\nSearch failed: {e}\n")
 
 def ia_metadata_files(identifier: str) -> List[IAFile]:
-    p = run(["ia", "metadata", identifier, "--json"])
-    meta = json.loads(p.stdout)
-    files = []
-    for f in meta.get("files", []) or []:
-        name = str(f.get("name", "")).strip()
-        if not name:
-            continue
-        size_raw = f.get("size", 0)
-        try:
-            size = int(size_raw) if size_raw is not None else 0
-        except Exception:
-            size = 0
-        fmt = str(f.get("format", "")).strip()
-        files.append(IAFile(name=name, size=size, fmt=fmt))
-    return files
+    return list(get_files(identifier))
 
 def is_video_file(f: IAFile) -> bool:
-    ext = os.path.splitext(f.name.lower())[1]
-    if ext in VIDEO_EXTS:
-        return True
-    fmt_l = (f.fmt or "").lower()
-    return any(h in fmt_l for h in VIDEO_FORMAT_HINTS)
+    return f.ext in VIDEO_EXTS or bool(_VIDEO_FMT_RE.search(f.fmt or ""))
 
 def filter_video_files(files: List[IAFile], keyword: Optional[str]) -> List[IAFile]:
-    vids = [f for f in files if is_video_file(f)]
+    vids = (f for f in files if is_video_file(f))
     if keyword:
-        rx = re.compile(re.escape(keyword), re.IGNORECASE)
-        vids = [f for f in vids if rx.search(f.name) or rx.search(f.fmt)]
+        rx = re.compile(re.escape(keyword.lower()))
+        vids = (f for f in vids if rx.search(f.haystack))
     # Sort biggest first, usually the main video is the largest
-    vids.sort(key=lambda x: x.size or 0, reverse=True)
-    return vids
+    return sorted(vids, key=lambda x: x.size or 0, reverse=True)
 
-def download_file(identifier: str, filename: str, dest: str) -> None:
+def download_file(identifier: str, filename: str, dest: str, size: int = 0) -> None:
     os.makedirs(dest, exist_ok=True)
-    cmd = ["ia", "download", identifier, "--destdir", dest, "--files", filename]
-    print("\nDownloading:")
-    print("  " + " ".join(cmd))
-    run(cmd, check=True)
+    if ia is None:
+        cmd = ["ia", "download", identifier, "--destdir", dest, "--files", filename]
+        print("\nDownloading:")
+        print("  " + " ".join(cmd))
+        run(cmd, check=True)
+    else:
+        print("\nDownloading:")
+        print(f"  {identifier} / {filename}")
+        try:
+            fetch_to_disk(identifier, filename, dest, size)
+        except Exception as e:
+            print("\nThat download failed:")
+            print("\n" + str(e) + "\n")
+            sys.exit(1)
     print("\nDone.")
     print(f"Saved to: {os.path.join(dest, identifier, filename)}")
 
+def read_batch(path: str) -> List[Tuple[str, str]]:
+    # One job per line: identifier, optionally followed by a TAB and a filename glob.
+    jobs: List[Tuple[str, str]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            ident, _, pat = line.partition("\t")
+            if ident.strip():
+                jobs.append((ident.strip(), pat.strip()))
+    return jobs
+
+def batch_files(identifier: str, pat: str) -> List[IAFile]:
+    files = ia_metadata_files(identifier)
+    if pat:
+        return [f for f in files if match_glob(f.name, pat)]
+    # No glob: same pick as the interactive flow would suggest, the biggest video.
+    vids = filter_video_files(files, None)
+    return vids[:1]
+
+def run_batch(path: str, dest: str) -> int:
+    if ia is None:
+        print("\nBatch mode needs the internetarchive Python package.")
+        print("Install with: pip3 install --user internetarchive\n")
+        return 2
+    try:
+        jobs = read_batch(path)
+    except OSError as e:
+        print(f"\nCould not read batch file: {e}")
+        return 2
+    if not jobs:
+        print("\nBatch file has no identifiers.")
+        return 1
+
+    os.makedirs(dest, exist_ok=True)
+    failed = 0
+    # One pool for everything: metadata lookups for all items run together, and each
+    # item's downloads are queued as soon as its file list is known.
+    with ThreadPoolExecutor(max_workers=BATCH_WORKERS) as ex:
+        lookups = {ex.submit(batch_files, ident, pat): (ident, pat) for ident, pat in jobs}
+        downloads = {}
+        queued = set()
+        for fut in as_completed(lookups):
+            ident, pat = lookups[fut]
+            try:
+                files = fut.result()
+            except Exception as e:
+                print(f"{ident}: could not read metadata ({e})")
+                failed += 1
+                continue
+            if not files:
+                print(f"{ident}: no files matched{f' {pat}' if pat else ''}")
+                failed += 1
+                continue
+            for f in files:
+                # Two lines can select the same file; fetching it twice at once would have both
+                # writers streaming into one .part file.
+                if (ident, f.name) in queued:
+                    continue
+                queued.add((ident, f.name))
+                downloads[ex.submit(fetch_to_disk, ident, f.name, dest, f.size)] = (ident, f.name)
+        for fut in as_completed(downloads):
+            ident, name = downloads[fut]
+            try:
+                print(f"Saved: {fut.result()}")
+            except Exception as e:
+                print(f"{ident} / {name}: download failed ({e})")
+                failed += 1
+
+    print(f"\nBatch done. {len(downloads)} download(s), {failed} problem(s).")
+    return 1 if failed else 0
+
 def main() -> int:
+    ap = argparse.ArgumentParser(prog="ia_easy", description="Internet Archive downloader (easy mode).")
+    ap.add_argument("--batch", metavar="FILE", help="Download every 'identifier[<TAB>glob]' line in FILE without prompting.")
+    ap.add_argument("--dest", help="Download folder (default: ~/Downloads).")
+    args = ap.parse_args()
+
+    if args.batch:
+        get_session()
+        return run_batch(args.batch, os.path.expanduser(args.dest or "~/Downloads"))
+
     print("\nInternet Archive Downloader (easy mode)")
     print("-------------------------------------")
     print("Tips:")
     print("- Press Enter on any prompt to cancel/back out.")
     print("- Search is limited to mediatype:movies by default.\n")
 
-    dest = prompt("Download folder (default: ~/Downloads): ")
+    dest = args.dest or prompt("Download folder (default: ~/Downloads): ")
     if not dest:
         dest = os.path.expanduser("~/Downloads")
     else:
         dest = os.path.expanduser(dest)
 
+    # Built once; every search/metadata/download in the loop below reuses it.
+    get_session()
+
     while True:
         q = prompt("\nSearch title (example: Test Copy) or full IA query: ")
         if q == "":
             print("\nBye.")
             return 0
 
-        results = ia_search_simple(q, rows=25)
-        if not results:
-            print("No results. Try different words.")
-            continue
-
-        print("\nResults:")
-        for i, r in enumerate(results, start=1):
+        # Print each hit as it arrives rather than waiting for the whole page.
+        results: List[SearchResult] = []
+        for r in ia_search_simple(q, rows=25):
+            if not results:
+                print("\nResults:")
+            results.append(r)
             y = f" ({r.year})" if r.year else ""
             title = (r.title[:80] + "...") if len(r.title) > 80 else r.title
-            print(f"{i:2d}. {title}{y}")
+            print(f"{len(results):2d}. {title}{y}")
             print(f"    id: {r.identifier}")
+        if not results:
+            print("No results. Try different words.")
+            continue
 
         idx = prompt_int("\nPick an item number to view files: ", 1, len(results))
         if idx is None:
@@ -177,7 +256,7 @@ def main() -> int:
         item = results[idx - 1]
         try:
             files = ia_metadata_files(item.identifier)
-        except json.JSONDecodeError:
+        except Exception:
             print("Could not read metadata for that item.")
             continue
 
@@ -193,12 +272,12 @@ def main() -> int:
             fmt = f.fmt if f.fmt else ""
             print(f"{i:2d}. {human_size(f.size):>10}  {fmt:<22}  {f.name}")
 
-        fidx = prompt_int("\nPick a file number to download: ", 1, len(vids))
+        fidx = prompt_int("\nPick a file number (or Tab-complete a name) to download: ", 1, len(vids), [f.name for f in vids])
         if fidx is None:
             continue
 
         chosen = vids[fidx - 1]
-        download_file(item.identifier, chosen.name, dest)
+        download_file(item.identifier, chosen.name, dest, chosen.size)
 
         again = prompt("\nDownload another? (y/n): ").lower()
         if again not in ("y", "yes"):
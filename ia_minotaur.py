@@ -1,13 +1,38 @@
 #!/usr/bin/env python3
+import atexit
+import bisect
 import curses
 import json
+import math
 import os
+import queue
 import re
+import selectors
 import shutil
 import subprocess
+import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Deque, List, Tuple, Optional, Dict, Any
+from urllib.parse import quote
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+try:
+    import urllib3
+except ImportError:
+    # Search and metadata fall back to shelling out to curl.
+    urllib3 = None
 
 
 MEDIA_ROOT = "/mnt/ssd/media"
@@ -18,13 +43,30 @@ BUCKET_MOVIES = os.path.join(MEDIA_ROOT, "Movies")
 BUCKET_OTHER = os.path.join(MEDIA_ROOT, "Other")
 
 FAVS_PATH = os.path.join(MEDIA_ROOT, ".ia_favorites.json")
+# Favorites are written this long after the last change, so bursts of toggles cost one write.
+FAVS_SAVE_DELAY_S = 1.0
 LOG_PATH = os.path.join(MEDIA_ROOT, ".ia_dl.log")
 
 FILTERS = ["movies", "audio", "texts", "software", "any"]
+BUCKETS = ["TV", "Movies", "Other"]
+FAVS_TABS = ["ITEMS", "FILES", "FOLDERS"]
+# current -> next, for the Filter / Save-to / favorites Tab menu toggles.
+_FILTER_NEXT = dict(zip(FILTERS, FILTERS[1:] + FILTERS[:1]))
+_BUCKET_NEXT = dict(zip(BUCKETS, BUCKETS[1:] + BUCKETS[:1]))
+_FAVS_TAB_NEXT = dict(zip(FAVS_TABS, FAVS_TABS[1:] + FAVS_TABS[:1]))
 ROWS_PER_PAGE = 30
 
 MIN_H = 18
 MIN_W = 70
+# Shortest gap between two frames of the input loop (~30 FPS); faster key bursts are coalesced.
+MIN_FRAME_S = 1 / 30
+# The DOWNLOADING details panel resamples speed/ETA this often, smoothing with this weight
+# on the newest interval; ETAs beyond 99h59m are shown as that.
+DL_STATS_S = 1.0
+DL_STATS_EMA = 0.3
+DL_ETA_MAX_S = 99 * 3600 + 59 * 60
+# Formatted file-list rows kept between frames.
+ROW_CACHE_MAX = 1024
 
 # Keep downloaded file mtimes as "now" so normal tools like find -mmin work as expected.
 # This also reduces confusion when verifying "new downloads" by timestamp.
@@ -43,6 +85,60 @@ VIDEO_FORMAT_HINTS = (
 )
 LARGE_VIDEO_BYTES = 500 * 1024 * 1024
 
+# Metadata for the first results on a page is fetched in the background so Enter opens instantly.
+META_PREFETCH_N = 10
+META_WORKERS = 5
+META_CACHE_MAX = 32
+
+SEARCH_URL = "https://archive.org/advancedsearch.php"
+METADATA_URL = "https://archive.org/metadata/"
+DOWNLOAD_URL = "https://archive.org/download/"
+SEARCH_FIELDS = ("identifier", "title", "year", "creator")
+
+# Full-item downloads run this many files at once (kept low to be polite to archive.org).
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK = 1 << 20
+# Time constant (seconds) of the smoothed download speed.
+SPEED_EWMA_S = 2.0
+
+_http = None
+
+_SANITIZE_RX = re.compile(r"[\/\\:\*\?\"<>\|]+")
+_WS_RX = re.compile(r"\s+")
+_SXXEYY_RX = re.compile(r"[Ss](\d{1,2})[Ee](\d{1,2})")
+_BRACKETS_RX = re.compile(r"[\[\](){}]")
+_DOTUNDER_RX = re.compile(r"[._]+")
+_YEAR_RX = re.compile(r"\b(19\d{2}|20\d{2})\b")
+# Rights markers for is_openly_licensed; deny is checked first.
+_DENY_RX = re.compile("|".join(map(re.escape, (
+    "all rights reserved",
+    "copyright",
+    "no redistribution",
+    "permission required",
+))))
+_ALLOW_RX = re.compile("|".join(map(re.escape, (
+    "creativecommons.org",
+    "cc-by",
+    "cc0",
+    "public domain",
+    "publicdomain",
+    "no known copyright",
+))))
+# "12.3MiB/27.3MiB"-style counters in ia/tqdm progress output.
+_PROGRESS_RX = re.compile(r"(\d+(?:\.\d+)?)\s*([kKMGT]?)i?B?\s*/\s*(\d+(?:\.\d+)?)\s*([kKMGT]?)i?B?")
+_SIZE_MULT = {"": 1, "k": 1 << 10, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+_SCENE_RX = re.compile(
+    r"\b(?:"
+    r"2160p|1080p|720p|480p|"
+    r"bluray|brrip|bdrip|webrip|web-dl|hdrip|dvdrip|"
+    r"x264|x265|h264|h265|hevc|av1|"
+    r"aac2?\.0|aac|dts(?:-?hd)?|ddp?5?\.1|ac3|"
+    r"proper|repack|extended|remastered|unrated|"
+    r"yify|yts|rarbg"
+    r")\b",
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class SearchResult:
@@ -55,17 +151,47 @@ class SearchResult:
 @dataclass
 class IAFile:
     name: str
-    size: int
+    size: int  # always an int; files_from_meta coerces missing or bad values to 0
     fmt: str
 
 
+@dataclass(frozen=True)
+class BucketPlan:
+    # Where imported files go, as answered once in choose_bucket_once.
+    bucket: str
+    folder: str
+    season: int = 1
+    episode: Optional[int] = None  # TV without SxxEyy in the name: rename to this episode
+
+
+# Log lines are written by one background thread that keeps the file open, so callers
+# (the UI thread included) only pay for a queue put.
+_LOG_Q: "queue.Queue[str]" = queue.Queue()
+
+
+def _log_writer() -> None:
+    f = None
+    while True:
+        lines = [_LOG_Q.get()]
+        while True:
+            try:
+                lines.append(_LOG_Q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            if f is None:
+                f = open(LOG_PATH, "a", encoding="utf-8")
+            f.writelines(lines)
+            f.flush()
+        except Exception:
+            f = None
+        for _ in lines:
+            _LOG_Q.task_done()
+
+
 def log_line(msg: str) -> None:
-    try:
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(f"{ts} {msg}\n")
-    except Exception:
-        pass
+    ts = time.strftime("%Y-%m-%d %H:%M:%S")
+    _LOG_Q.put_nowait(f"{ts} {msg}\n")
 
 
 def run_cmd(cmd: List[str], timeout: int = 60) -> Tuple[int, str, str]:
@@ -90,20 +216,125 @@ def run_cmd(cmd: List[str], timeout: int = 60) -> Tuple[int, str, str]:
         return 124, "", "command timed out"
 
 
+def _pump_lines(p: subprocess.Popen, on_line: Callable[[str], None], on_eof: Optional[Callable[[], None]]) -> None:
+    try:
+        for line in p.stdout:
+            on_line(line.rstrip("\n"))
+    except Exception:
+        pass
+    if on_eof:
+        on_eof()
+
+
+def run_cmd_stream(
+    cmd: List[str], on_line: Callable[[str], None], on_eof: Optional[Callable[[], None]] = None
+) -> Tuple[subprocess.Popen, threading.Thread]:
+    # Start cmd with stdout+stderr merged and feed each line to on_line from a reader thread,
+    # so progress can be shown live and a chatty process never blocks on a full pipe.
+    # Text mode splits on "\r" as well, which is how progress bars redraw.
+    log_line(f"CMD: {' '.join(cmd)}")
+    p = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, errors="replace"
+    )
+    reader = threading.Thread(target=_pump_lines, args=(p, on_line, on_eof), daemon=True)
+    reader.start()
+    return p, reader
+
+
+class ActivityWaiter:
+    # Lets a progress loop sleep until the download process prints something (or exits),
+    # the user presses a key, or the timeout passes -- instead of a fixed sleep.
+    def __init__(self) -> None:
+        self._r, self._w = os.pipe()
+        os.set_blocking(self._r, False)
+        os.set_blocking(self._w, False)
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self._r, selectors.EVENT_READ)
+        self._keys_watched = False
+        try:
+            # curses reads keys from stdin.
+            self._sel.register(sys.stdin, selectors.EVENT_READ)
+            self._keys_watched = True
+        except (AttributeError, ValueError, OSError):
+            pass
+
+    def wake(self) -> None:
+        # Safe to call from any thread.
+        try:
+            os.write(self._w, b"\0")
+        except OSError:
+            pass
+
+    def wait(self, timeout: float) -> bool:
+        # Returns whether a key may be waiting, so callers can skip reading curses otherwise.
+        events = self._sel.select(timeout)
+        try:
+            while os.read(self._r, 4096):
+                pass
+        except OSError:
+            pass
+        return not self._keys_watched or any(key.fd != self._r for key, _ in events)
+
+    def close(self) -> None:
+        self._sel.close()
+        os.close(self._r)
+        os.close(self._w)
+
+    def __enter__(self) -> "ActivityWaiter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def parse_progress(line: str) -> Optional[Tuple[int, int]]:
+    m = _PROGRESS_RX.search(line)
+    if not m:
+        return None
+    done = int(float(m.group(1)) * _SIZE_MULT[m.group(2)])
+    total = int(float(m.group(3)) * _SIZE_MULT[m.group(4)])
+    return done, total
+
+
+class StreamedOutput:
+    # on_line sink for run_cmd_stream: keeps the last lines and the latest progress counter.
+    def __init__(self, wake: Optional[Callable[[], None]] = None) -> None:
+        self.tail: Deque[str] = deque(maxlen=40)
+        self.written = 0
+        self.total = 0
+        self._wake = wake
+
+    def __call__(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+        got = parse_progress(line)
+        if got:
+            self.written, self.total = got
+        else:
+            self.tail.append(line)
+        if self._wake:
+            self._wake()
+
+    def text(self) -> str:
+        return "\n".join(self.tail)
+
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+# Called for every file row, detail line and progress update; the same sizes come back each frame.
+@lru_cache(maxsize=4096)
 def human_size(n: int) -> str:
     try:
         n = int(n)
     except Exception:
         return "?"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    f = float(n)
-    i = 0
-    while f >= 1024 and i < len(units) - 1:
-        f /= 1024.0
-        i += 1
-    if i == 0:
-        return f"{int(f)}{units[i]}"
-    return f"{f:.2f}{units[i]}"
+    if n < 1024:
+        return f"{n}B"
+    # Unit index straight from the bit length (each unit is 10 bits), no division loop.
+    i = min((n.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{n / (1 << (10 * i)):.2f}{SIZE_UNITS[i]}"
 
 
 def ensure_dirs() -> None:
@@ -115,18 +346,22 @@ def ensure_dirs() -> None:
 
 def sanitize_folder(name: str) -> str:
     name = (name or "").strip()
-    name = re.sub(r"[\/\\:\*\?\"<>\|]+", "", name)
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _SANITIZE_RX.sub("", name)
+    name = _WS_RX.sub(" ", name).strip()
     return name or "Unknown"
 
 
+# Called on the file name and again on the item title for every import of a batch.
+@lru_cache(maxsize=2048)
 def detect_sxxeyy(text: str) -> Optional[Tuple[int, int]]:
-    m = re.search(r"[Ss](\d{1,2})[Ee](\d{1,2})", text or "")
+    m = _SXXEYY_RX.search(text or "")
     if not m:
         return None
     return int(m.group(1)), int(m.group(2))
 
 
+# Both are pure and see the same names again and again (every file list scan / bucket pick).
+@lru_cache(maxsize=2048)
 def is_video_file(name: str, fmt: str = "") -> bool:
     ext = os.path.splitext((name or "").lower())[1]
     if ext in VIDEO_EXTS:
@@ -135,35 +370,40 @@ def is_video_file(name: str, fmt: str = "") -> bool:
     return any(h in fmt_l for h in VIDEO_FORMAT_HINTS)
 
 
+def has_year_hint(s: str) -> bool:
+    # Any "19dd"/"20dd" run, unanchored: "(1993)", "- 1993 -" and "Movie.1993.mkv" all count.
+    # str.find does the scanning in C; no regex needed for a fixed two-char lead.
+    if not s:
+        return False
+    for lead in ("19", "20"):
+        i = s.find(lead)
+        while i != -1:
+            tail = s[i + 2:i + 4]
+            if len(tail) == 2 and tail.isdecimal():
+                return True
+            i = s.find(lead, i + 1)
+    return False
+
+
+@lru_cache(maxsize=512)
 def auto_clean_movie_folder_name(item_title: str, filename: str) -> str:
     raw = (item_title or "").strip() or (filename or "").strip()
     raw = os.path.basename(raw)
     raw = os.path.splitext(raw)[0]
-    raw = re.sub(r"[\[\](){}]", " ", raw)
-    raw = re.sub(r"[._]+", " ", raw)
-    raw = re.sub(r"\s+", " ", raw).strip()
+    raw = _BRACKETS_RX.sub(" ", raw)
+    raw = _DOTUNDER_RX.sub(" ", raw)
+    raw = _WS_RX.sub(" ", raw).strip()
 
     year = ""
-    year_match = re.search(r"\b(19\d{2}|20\d{2})\b", raw)
+    year_match = _YEAR_RX.search(raw)
     if year_match:
         year = year_match.group(1)
         title_part = raw[: year_match.start()]
     else:
         title_part = raw
 
-    scene_rx = re.compile(
-        r"\b(?:"
-        r"2160p|1080p|720p|480p|"
-        r"bluray|brrip|bdrip|webrip|web-dl|hdrip|dvdrip|"
-        r"x264|x265|h264|h265|hevc|av1|"
-        r"aac2?\.0|aac|dts(?:-?hd)?|ddp?5?\.1|ac3|"
-        r"proper|repack|extended|remastered|unrated|"
-        r"yify|yts|rarbg"
-        r")\b",
-        re.IGNORECASE,
-    )
-    title_part = scene_rx.sub(" ", title_part)
-    title_part = re.sub(r"\s+", " ", title_part).strip(" -._")
+    title_part = _SCENE_RX.sub(" ", title_part)
+    title_part = _WS_RX.sub(" ", title_part).strip(" -._")
 
     cleaned_title = sanitize_folder(title_part or raw)
     if year:
@@ -206,37 +446,40 @@ def ia_ok() -> Tuple[bool, str]:
     return False, msg or "ia not available"
 
 
-def ia_search_via_curl(query: str, rows: int, page: int) -> Tuple[List[SearchResult], int, str]:
-    cmd = [
-        "curl",
-        "-sS",
-        "-G",
-        "https://archive.org/advancedsearch.php",
-        "--data-urlencode",
-        f"q={query}",
-        "--data-urlencode",
-        "fl[]=identifier",
-        "--data-urlencode",
-        "fl[]=title",
-        "--data-urlencode",
-        "fl[]=year",
-        "--data-urlencode",
-        "fl[]=creator",
-        "--data-urlencode",
-        "output=json",
-        "--data-urlencode",
-        f"rows={rows}",
-        "--data-urlencode",
-        f"page={page}",
-    ]
+def http_pool():
+    # One PoolManager for the whole session: search pages, metadata fetches and file
+    # downloads all reuse kept-alive TLS connections instead of forking curl / ia.
+    # maxsize covers META_WORKERS + DOWNLOAD_WORKERS running at once.
+    global _http
+    if _http is None and urllib3 is not None:
+        _http = urllib3.PoolManager(
+            num_pools=2,
+            maxsize=10,
+            block=False,
+            timeout=urllib3.Timeout(connect=10, read=60),
+            retries=urllib3.Retry(total=3, backoff_factor=0.3),
+        )
+    return _http
 
-    code, out, err = run_cmd(cmd, timeout=60)
-    if code != 0:
-        msg = (err or out).strip()
-        return [], 0, msg or f"search failed (code {code})"
 
+def http_get(url: str, fields: Optional[List[Tuple[str, str]]] = None) -> Tuple[int, str, str]:
+    # Same (code, out, err) shape as run_cmd; code is 0 on HTTP 2xx.
+    log_line(f"GET: {url}")
+    try:
+        r = http_pool().request("GET", url, fields=fields)
+    except urllib3.exceptions.HTTPError as e:
+        log_line(f"ERR: {e}")
+        return 1, "", str(e)
+    log_line(f"HTTP: {r.status}")
+    out = r.data.decode("utf-8", "replace")
+    if not 200 <= r.status < 300:
+        return r.status, "", f"HTTP {r.status} from {url}"
+    return 0, out, ""
+
+
+def parse_search_json(out: str) -> Tuple[List[SearchResult], int, str]:
     try:
-        data = json.loads(out)
+        data = json_loads(out)
     except json.JSONDecodeError:
         return [], 0, "search returned non-JSON"
 
@@ -256,25 +499,87 @@ def ia_search_via_curl(query: str, rows: int, page: int) -> Tuple[List[SearchRes
     return results, num_found, ""
 
 
+def ia_search(query: str, rows: int, page: int) -> Tuple[List[SearchResult], int, str]:
+    if http_pool() is None:
+        return ia_search_via_curl(query, rows, page)
+    params = [("q", query)]
+    params += [("fl[]", fl) for fl in SEARCH_FIELDS]
+    params += [("output", "json"), ("rows", str(rows)), ("page", str(page))]
+    code, out, err = http_get(SEARCH_URL, fields=params)
+    if code != 0:
+        return [], 0, err or f"search failed (code {code})"
+    return parse_search_json(out)
+
+
+def ia_search_via_curl(query: str, rows: int, page: int) -> Tuple[List[SearchResult], int, str]:
+    cmd = ["curl", "-sS", "-G", SEARCH_URL, "--data-urlencode", f"q={query}"]
+    for fl in SEARCH_FIELDS:
+        cmd += ["--data-urlencode", f"fl[]={fl}"]
+    cmd += [
+        "--data-urlencode",
+        "output=json",
+        "--data-urlencode",
+        f"rows={rows}",
+        "--data-urlencode",
+        f"page={page}",
+    ]
+
+    code, out, err = run_cmd(cmd, timeout=60)
+    if code != 0:
+        msg = (err or out).strip()
+        return [], 0, msg or f"search failed (code {code})"
+    return parse_search_json(out)
+
+
 def ia_metadata_json(identifier: str) -> Tuple[Optional[Dict[str, Any]], str]:
-    code, out, err = run_cmd(["ia", "metadata", identifier], timeout=60)
+    # Same JSON as `ia metadata`, straight from the Metadata API (no Python interpreter per call).
+    if http_pool() is not None:
+        code, out, err = http_get(METADATA_URL + identifier)
+    else:
+        code, out, err = run_cmd(["curl", "-sS", "-f", METADATA_URL + identifier], timeout=60)
     if code != 0:
         msg = (err or out).strip()
         return None, msg or f"metadata failed (code {code})"
     try:
-        return json.loads(out), ""
+        return json_loads(out), ""
     except json.JSONDecodeError:
-        m = re.search(r"(\{.*\})\s*$", out.strip(), re.DOTALL)
-        if m:
-            try:
-                return json.loads(m.group(1)), ""
-            except Exception:
-                pass
-        return None, "metadata returned non-JSON"
-
-
-def ia_files(identifier: str) -> Tuple[List[IAFile], Optional[Dict[str, Any]], str]:
-    meta, err = ia_metadata_json(identifier)
+        pass
+    # Noise before the JSON: walk back through the '{' positions until the tail parses.
+    idx = out.rfind("{")
+    while idx != -1:
+        try:
+            return json_loads(out[idx:]), ""
+        except json.JSONDecodeError:
+            idx = out.rfind("{", 0, idx)
+    return None, "metadata returned non-JSON"
+
+
+def http_download(identifier: str, filename: str, dest: str, on_bytes: Callable[[int], None], cancel: threading.Event) -> None:
+    # Stream one file into dest in DOWNLOAD_CHUNK pieces; raises on HTTP errors or cancel.
+    if cancel.is_set():
+        raise RuntimeError("Canceled.")
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    url = DOWNLOAD_URL + identifier + "/" + quote(filename)
+    log_line(f"GET: {url}")
+    r = http_pool().request("GET", url, preload_content=False)
+    try:
+        if not 200 <= r.status < 300:
+            raise RuntimeError(f"HTTP {r.status} for {filename}")
+        # read1 hands back whatever has arrived (up to a chunk) instead of waiting to fill one,
+        # so progress and cancel checks keep up on slow links; urllib3 < 2 lacks it.
+        read1 = getattr(r, "read1", None)
+        chunks = iter(lambda: read1(DOWNLOAD_CHUNK), b"") if read1 else r.stream(DOWNLOAD_CHUNK)
+        with open(dest, "wb") as out:
+            for chunk in chunks:
+                if cancel.is_set():
+                    raise RuntimeError("Canceled.")
+                out.write(chunk)
+                on_bytes(len(chunk))
+    finally:
+        r.release_conn()
+
+
+def files_from_meta(meta: Optional[Dict[str, Any]], err: str) -> Tuple[List[IAFile], Optional[Dict[str, Any]], str]:
     if err or not meta:
         return [], None, err or "metadata error"
 
@@ -291,38 +596,23 @@ def ia_files(identifier: str) -> Tuple[List[IAFile], Optional[Dict[str, Any]], s
         fmt = str(f.get("format", "")).strip()
         files.append(IAFile(name=name, size=size, fmt=fmt))
 
-    files.sort(key=lambda x: x.size or 0, reverse=True)
+    # size is always an int here (coerced above), so no "or 0" guard is needed.
+    files.sort(key=attrgetter("size"), reverse=True)
     return files, meta, ""
 
 
 def is_openly_licensed(meta: Dict[str, Any]) -> Tuple[bool, str]:
     m = meta.get("metadata", {}) or {}
-    licenseurl = str(m.get("licenseurl", "") or "").lower()
-    rights = str(m.get("rights", "") or "").lower()
-    possible = [licenseurl, rights]
-
-    allow_markers = [
-        "creativecommons.org",
-        "cc-by",
-        "cc0",
-        "public domain",
-        "publicdomain",
-        "no known copyright",
-    ]
-    deny_markers = [
-        "all rights reserved",
-        "copyright",
-        "no redistribution",
-        "permission required",
-    ]
+    fields = (str(m.get("licenseurl", "") or "").lower(), str(m.get("rights", "") or "").lower())
 
-    joined = " | ".join([p for p in possible if p])
-    for d in deny_markers:
-        if d in joined:
-            return False, f"Blocked by rights metadata: {d}"
+    # Scan each field in place (no joined copy), stopping at the first hit.
+    for fld in fields:
+        d = _DENY_RX.search(fld) if fld else None
+        if d:
+            return False, f"Blocked by rights metadata: {d.group(0)}"
 
-    for a in allow_markers:
-        if a in joined:
+    for fld in fields:
+        if fld and _ALLOW_RX.search(fld):
             return True, "Open license detected"
 
     return False, "No clear open license in metadata (licenseurl/rights)."
@@ -343,23 +633,109 @@ def safe_getsize(path: str) -> int:
         return 0
 
 
-def dir_total_size(root: str) -> int:
+def dir_total_size(root: str, expected: Optional[Dict[str, int]] = None, finished: Optional[Dict[str, int]] = None) -> int:
+    # scandir hands back cached dirent info, so each file costs at most one stat
+    # and no Python-level path joins (os.walk + getsize paid for both).
+    # When polling repeatedly, pass expected (path -> final size) and a finished dict kept
+    # across calls: files that reached their expected size are remembered and not re-stat'ed.
     total = 0
-    try:
-        for base, _dirs, files in os.walk(root):
-            for fn in files:
-                p = os.path.join(base, fn)
-                total += safe_getsize(p)
-    except Exception:
-        return 0
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif finished is not None and entry.path in finished:
+                            total += finished[entry.path]
+                        else:
+                            size = entry.stat(follow_symlinks=False).st_size
+                            if finished is not None and expected and size and expected.get(entry.path) == size:
+                                finished[entry.path] = size
+                            total += size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
     return total
 
 
+def move_no_clobber(src: str, dst: str, stamp: Optional[str] = None) -> str:
+    # Move src to dst without overwriting; on a name clash use dst with a timestamp suffix
+    # (stamp, when a batch passes one it computed once, else the current time).
+    # os.rename would silently replace dst on POSIX, so hard-link (fails with FileExistsError
+    # if dst exists) and unlink instead: no exists() probe up front, and no check-then-move race.
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        clash = True
+    except OSError:
+        # Cross-device or no hard-link support: check first, as before.
+        clash = os.path.exists(dst)
+    else:
+        os.unlink(src)
+        return dst
+    if clash:
+        base, ext = os.path.splitext(dst)
+        stamp = stamp or time.strftime("%Y%m%d_%H%M%S")
+        dst = f"{base}_{stamp}{ext}"
+        # A shared batch stamp can clash too (two files renamed alike); number those.
+        n = 1
+        while os.path.exists(dst):
+            n += 1
+            dst = f"{base}_{stamp}_{n}{ext}"
+    shutil.move(src, dst)
+    return dst
+
+
+class DaemonPool:
+    # Minimal executor on daemon threads. ThreadPoolExecutor workers are joined at interpreter
+    # exit, so quitting with a metadata fetch in flight would hang until its request gave up;
+    # these threads are simply dropped.
+    def __init__(self, workers: int, name: str):
+        self._q: "queue.Queue[Optional[Tuple[Future, Callable[..., Any], tuple]]]" = queue.Queue()
+        self._workers = workers
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"{name}-{i}", daemon=True).start()
+
+    def _work(self) -> None:
+        while True:
+            job = self._q.get()
+            if job is None:
+                return
+            fut, fn, args = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args))
+            except BaseException as e:
+                fut.set_exception(e)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        fut: Future = Future()
+        self._q.put((fut, fn, args))
+        return fut
+
+    def shutdown(self) -> None:
+        # Cancel what hasn't started and let idle workers exit; running jobs are not waited on.
+        while True:
+            try:
+                job = self._q.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[0].cancel()
+        for _ in range(self._workers):
+            self._q.put(None)
+
+
 class RetroWaveIA:
     def __init__(self, stdscr):
         self.stdscr = stdscr
 
-        self.ia_present, self.ia_version = ia_ok()
+        # Assumed present until the `ia --version` check (see _ia_check) comes back.
+        self.ia_present, self.ia_version = True, ""
         self.status = "Ready"
         self.mode = "RESULTS"  # RESULTS / FILES / FAVS / HELP / ERROR / DOWNLOADING / TOO_SMALL / PREVIEW_DL
 
@@ -375,29 +751,76 @@ class RetroWaveIA:
         self.sel_r = 0
 
         self.files: List[IAFile] = []
+        # self.files ordered by name, and the names alone, for bisecting prefix ranges.
+        self._sorted_files: List[IAFile] = []
+        self._sorted_names: List[str] = []
         self.sel_f = 0
         self.file_kw = ""
+        # (files list, keyword, visible files) from the last get_visible_files call.
+        self._vf_cache: Optional[Tuple[List[IAFile], str, List[IAFile]]] = None
+        # (files list, single large video name) for single_large_video_name.
+        self._large_video_cache: Optional[Tuple[List[IAFile], Optional[str]]] = None
 
         self.last_bucket = "TV"  # TV/Movies/Other
-        self.download_log: List[str] = []
+        # Directories known to exist (see ensure_dir).
+        self._known_dirs: set = set()
+        # Newest first; only as many entries as the RECENT panel shows.
+        self.download_log: Deque[str] = deque(maxlen=5)
         self.show_welcome = True
 
         self.focus = "MENU"  # MENU or LIST
         self.menu_idx = 0
+        # (state key, [(pill, pill_len, action), ...]) for the last menu built.
+        self._menu_cache: Optional[Tuple[tuple, List[Tuple[str, int, str]]]] = None
+        # Screen size for the frame being drawn, plus prebuilt banner/footer strings per width.
+        self._frame_hw: Tuple[int, int] = (0, 0)
+        self._banner_cache: Optional[Tuple[int, int, str, str, str]] = None
+        self._footer_cache: Optional[Tuple[Tuple[int, str], str, str]] = None
+        # Row damage tracking for render(): the writes of the frame being built (None outside
+        # render), what each screen row last got, and the size those rows were drawn at.
+        # A row whose writes match the last frame is left alone instead of erased and redrawn.
+        self._frame_rows: Optional[Dict[int, List[Tuple[int, str, int]]]] = None
+        self._drawn_rows: Dict[int, Optional[List[Tuple[int, str, int]]]] = {}
+        self._drawn_hw: Tuple[int, int] = (0, 0)
+        # Whether the last frame was the "Terminal too small" notice.
+        self._too_small_shown = False
+        # monotonic() of the last render, for the input loop's frame-rate gate.
+        self._last_render = 0.0
 
         self.exit_requested = False
 
         self.favs = self.load_favs()
+        # Held while self.favs is mutated or serialized (the save runs on a timer thread).
+        self._favs_lock = threading.Lock()
+        self._favs_dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        atexit.register(self._flush_favs)
+        # Set indexes over favs["items"] / favs["files"] so per-row star checks are O(1).
+        self._fav_item_ids: set = set()
+        self._fav_file_keys: set = set()
+        self.reindex_favs()
         self.favs_tab = "ITEMS"  # ITEMS / FILES / FOLDERS
         self.favs_idx = 0
 
         self.cur_meta: Optional[Dict[str, Any]] = None
+        # (metadata dict, is_openly_licensed result) for the last cur_meta checked.
+        self._license_cache: Optional[Tuple[Dict[str, Any], Tuple[bool, str]]] = None
+
+        # identifier -> Future[(meta, err)], oldest first; trimmed to META_CACHE_MAX.
+        self._meta_pool = DaemonPool(META_WORKERS, "ia-meta")
+        # `ia --version` starts a whole Python process; it runs while loop() draws the first frame.
+        self._ia_check: Future = self._meta_pool.submit(ia_ok)
+        self._meta_cache: "OrderedDict[str, Future]" = OrderedDict()
 
         self.preview_item: Optional[SearchResult] = None
         self.preview_file: Optional[IAFile] = None
         self.preview_files: List[IAFile] = []
         self.preview_prefix: str = ""
         self.preview_msg: str = ""
+        # Byte total of the previewed file(s), computed once when the preview is set up.
+        self.preview_total: int = 0
+        # (visible files list, its byte total) from the last visible_total call.
+        self._visible_total_cache: Optional[Tuple[List[IAFile], int]] = None
 
         self.dl_current_name: str = ""
         self.dl_current_written: int = 0
@@ -407,10 +830,22 @@ class RetroWaveIA:
         self.dl_overall_written: int = 0
         self.dl_overall_total: int = 0
         self.dl_cancel_requested: bool = False
-
-        if not self.ia_present:
-            self.mode = "ERROR"
-            self.status = self.ia_version
+        self.dl_max_workers: int = DOWNLOAD_WORKERS
+        # Guards dl_overall_written / dl_speed_bps while download_files workers report bytes.
+        self._dl_lock = threading.Lock()
+        self._dl_rate_t: float = 0.0
+        self._dl_rate_bytes: int = 0
+        # Details-panel sampling (see _download_details): next sample time, the previous sample
+        # (download name, time, bytes), smoothed speed, and the lines built at the last sample
+        # along with the figures they show.
+        self._stats_next_t = 0.0
+        self._stats_last: Tuple[str, float, int] = ("", 0.0, 0)
+        self._ema_bps = 0.0
+        self._dl_details_cache: List[str] = []
+        self._dl_details_key: Optional[Tuple[str, int, int, int]] = None
+        # Formatted FILES rows, LRU by everything that shows in them (see _format_file_row).
+        self._row_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._actions = self._build_actions()
 
     # ---------- favorites persistence ----------
     def load_favs(self) -> Dict[str, Any]:
@@ -435,49 +870,70 @@ class RetroWaveIA:
             pass
         return base
 
-    def save_favs(self) -> None:
-        try:
-            tmp = FAVS_PATH + ".tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(self.favs, f, indent=2)
-            os.replace(tmp, FAVS_PATH)
-        except Exception:
-            pass
+    def mark_favs_dirty(self) -> None:
+        with self._favs_lock:
+            self._favs_dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(FAVS_SAVE_DELAY_S, self._flush_favs)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _flush_favs(self) -> None:
+        # Runs on the debounce timer thread, and from atexit for anything still pending.
+        with self._favs_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._favs_dirty:
+                return
+            self._favs_dirty = False
+            try:
+                if orjson is not None:
+                    data = orjson.dumps(self.favs, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(self.favs, indent=2).encode("utf-8")
+                tmp = FAVS_PATH + ".tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, FAVS_PATH)
+            except Exception:
+                pass
+
+    def reindex_favs(self) -> None:
+        self._fav_item_ids = {str(it.get("identifier", "")).strip() for it in self.favs.get("items", [])}
+        self._fav_file_keys = {
+            self.file_fav_key(it.get("identifier", ""), it.get("filename", "")) for it in self.favs.get("files", [])
+        }
 
     def is_fav_item(self, identifier: str) -> bool:
-        ident = (identifier or "").strip()
-        for it in self.favs.get("items", []):
-            if str(it.get("identifier", "")).strip() == ident:
-                return True
-        return False
+        return (identifier or "").strip() in self._fav_item_ids
 
     def toggle_fav_item(self, r: SearchResult) -> None:
         ident = (r.identifier or "").strip()
         if not ident:
             return
-        items = self.favs.get("items", [])
-        if not isinstance(items, list):
-            items = []
-            self.favs["items"] = items
-
-        if self.is_fav_item(ident):
-            self.favs["items"] = [it for it in items if str(it.get("identifier", "")).strip() != ident]
-            self.status = "Removed favorite item."
-        else:
-            items.insert(0, {"identifier": r.identifier, "title": r.title, "year": r.year, "creator": r.creator})
-            self.status = "Added favorite item."
-        self.save_favs()
+        with self._favs_lock:
+            items = self.favs.get("items", [])
+            if not isinstance(items, list):
+                items = []
+                self.favs["items"] = items
+
+            if self.is_fav_item(ident):
+                self.favs["items"] = [it for it in items if str(it.get("identifier", "")).strip() != ident]
+                self._fav_item_ids.discard(ident)
+                self.status = "Removed favorite item."
+            else:
+                items.insert(0, {"identifier": r.identifier, "title": r.title, "year": r.year, "creator": r.creator})
+                self._fav_item_ids.add(ident)
+                self.status = "Added favorite item."
+        self.mark_favs_dirty()
 
     def file_fav_key(self, identifier: str, filename: str) -> str:
         return f"{(identifier or '').strip()}::{(filename or '').strip()}"
 
     def is_fav_file(self, identifier: str, filename: str) -> bool:
-        key = self.file_fav_key(identifier, filename)
-        for it in self.favs.get("files", []):
-            k2 = self.file_fav_key(it.get("identifier", ""), it.get("filename", ""))
-            if k2 == key:
-                return True
-        return False
+        return self.file_fav_key(identifier, filename) in self._fav_file_keys
 
     def toggle_fav_file(self, item: SearchResult, f: IAFile) -> None:
         ident = (item.identifier or "").strip()
@@ -485,51 +941,61 @@ class RetroWaveIA:
         if not ident or not fname:
             return
 
-        files = self.favs.get("files", [])
-        if not isinstance(files, list):
-            files = []
-            self.favs["files"] = files
-
-        if self.is_fav_file(ident, fname):
-            self.favs["files"] = [
-                it
-                for it in files
-                if self.file_fav_key(it.get("identifier", ""), it.get("filename", "")) != self.file_fav_key(ident, fname)
-            ]
-            self.status = "Removed favorite file."
-        else:
-            files.insert(
-                0,
-                {
-                    "identifier": item.identifier,
-                    "item_title": item.title,
-                    "year": item.year,
-                    "creator": item.creator,
-                    "filename": f.name,
-                    "size": int(f.size or 0),
-                    "fmt": f.fmt,
-                },
-            )
-            self.status = "Added favorite file."
-        self.save_favs()
-
-    def add_folder_fav(self, bucket: str, folder_name: str) -> None:
+        with self._favs_lock:
+            files = self.favs.get("files", [])
+            if not isinstance(files, list):
+                files = []
+                self.favs["files"] = files
+
+            key = self.file_fav_key(ident, fname)
+            if key in self._fav_file_keys:
+                self.favs["files"] = [
+                    it
+                    for it in files
+                    if self.file_fav_key(it.get("identifier", ""), it.get("filename", "")) != key
+                ]
+                self._fav_file_keys.discard(key)
+                self.status = "Removed favorite file."
+            else:
+                files.insert(
+                    0,
+                    {
+                        "identifier": item.identifier,
+                        "item_title": item.title,
+                        "year": item.year,
+                        "creator": item.creator,
+                        "filename": f.name,
+                        "size": f.size,
+                        "fmt": f.fmt,
+                    },
+                )
+                self._fav_file_keys.add(key)
+                self.status = "Added favorite file."
+        self.mark_favs_dirty()
+
+    def add_folder_fav(self, bucket: str, name: str) -> None:
+        # name must already be sanitize_folder()'d (choose_bucket_and_path does that).
         bucket = bucket if bucket in ("TV", "Movies", "Other") else "Other"
-        name = sanitize_folder(folder_name)
-        arr = self.favs.get("folders", {}).get(bucket, [])
-        if not isinstance(arr, list):
-            self.favs["folders"][bucket] = []
-            arr = self.favs["folders"][bucket]
-        lowered = {str(x).strip().lower() for x in arr}
-        if name.strip().lower() not in lowered:
+        with self._favs_lock:
+            arr = self.favs.get("folders", {}).get(bucket, [])
+            if not isinstance(arr, list):
+                self.favs["folders"][bucket] = []
+                arr = self.favs["folders"][bucket]
+            # Batch imports re-add the same folder each time; an exact hit skips the case-folded scan.
+            if name in arr:
+                return
+            lowered = {str(x).strip().lower() for x in arr}
+            if name.strip().lower() in lowered:
+                return
             arr.insert(0, name)
             self.favs["folders"][bucket] = arr[:30]
-            self.save_favs()
+        self.mark_favs_dirty()
 
     # ---------- safe drawing ----------
     def safe_addstr(self, y: int, x: int, s: str, attr: int = 0) -> None:
         try:
-            h, w = self.stdscr.getmaxyx()
+            # Screen size is read once per frame (render/prompt), not once per string.
+            h, w = self._frame_hw
             if y < 0 or x < 0 or y >= h or x >= w:
                 return
             if w <= 1:
@@ -537,6 +1003,12 @@ class RetroWaveIA:
             s2 = s
             if x + len(s2) > w - 1:
                 s2 = s2[: max(0, (w - 1) - x)]
+            if self._frame_rows is not None:
+                # Inside render(): collected per row and written by _flush_rows.
+                self._frame_rows.setdefault(y, []).append((x, s2, attr))
+                return
+            # Drawn outside render (prompts): the next frame must repaint this row.
+            self._drawn_rows[y] = None
             if attr:
                 self.stdscr.addstr(y, x, s2, attr)
             else:
@@ -556,6 +1028,18 @@ class RetroWaveIA:
         curses.init_pair(7, curses.COLOR_BLACK, curses.COLOR_CYAN)
         curses.init_pair(8, curses.COLOR_BLACK, curses.COLOR_MAGENTA)
         curses.init_pair(9, curses.COLOR_BLACK, curses.COLOR_YELLOW)
+        # Attributes the draw code uses, computed once here instead of per write.
+        self._attr_accent = curses.color_pair(1)
+        self._attr_title = curses.color_pair(1) | curses.A_BOLD
+        self._attr_frame = curses.color_pair(2)
+        self._attr_hint = curses.color_pair(3)
+        self._attr_err = curses.color_pair(5)
+        self._attr_err_bold = curses.color_pair(5) | curses.A_BOLD
+        self._attr_normal = curses.color_pair(6)
+        self._attr_sel_result = curses.color_pair(7) | curses.A_BOLD
+        self._attr_bar = curses.color_pair(8)
+        self._attr_sel_file = curses.color_pair(8) | curses.A_BOLD
+        self._attr_sel_menu = curses.color_pair(9) | curses.A_BOLD
 
     def term_too_small(self) -> bool:
         h, w = self.stdscr.getmaxyx()
@@ -564,17 +1048,20 @@ class RetroWaveIA:
     # ---------- UI pieces ----------
     def draw_banner(self, w: int) -> int:
         y = 0
-        title = "MINOTAUR IA BROWSER"
-        banner_width = min(len(title) + 8, max(10, w - 2))
-        start_x = max(0, (w - banner_width) // 2)
-
-        top = "╔" + "═" * (banner_width - 2) + "╗"
-        mid = "║" + title.center(banner_width - 2) + "║"
-        bot = "╚" + "═" * (banner_width - 2) + "╝"
-
-        self.safe_addstr(y, start_x, top, curses.color_pair(2)); y += 1
-        self.safe_addstr(y, start_x, mid, curses.color_pair(1) | curses.A_BOLD); y += 1
-        self.safe_addstr(y, start_x, bot, curses.color_pair(2)); y += 1
+        if self._banner_cache is None or self._banner_cache[0] != w:
+            title = "MINOTAUR IA BROWSER"
+            banner_width = min(len(title) + 8, max(10, w - 2))
+            start_x = max(0, (w - banner_width) // 2)
+
+            top = "╔" + "═" * (banner_width - 2) + "╗"
+            mid = "║" + title.center(banner_width - 2) + "║"
+            bot = "╚" + "═" * (banner_width - 2) + "╝"
+            self._banner_cache = (w, start_x, top, mid, bot)
+        _w, start_x, top, mid, bot = self._banner_cache
+
+        self.safe_addstr(y, start_x, top, self._attr_frame); y += 1
+        self.safe_addstr(y, start_x, mid, self._attr_title); y += 1
+        self.safe_addstr(y, start_x, bot, self._attr_frame); y += 1
         return y + 1
 
     def draw_top_status(self, y: int, w: int) -> int:
@@ -602,22 +1089,48 @@ class RetroWaveIA:
         else:
             page_info = f"Page: {self.page}"
         line1 = f"{header}  |  Filter: {self.filter}  |  Search: {search_mode}  |  {page_info}"
-        self.safe_addstr(y, 0, line1[: max(0, w - 1)].ljust(max(0, w - 1)), curses.color_pair(3)); y += 1
+        self.safe_addstr(y, 0, line1[: max(0, w - 1)].ljust(max(0, w - 1)), self._attr_hint); y += 1
 
         if self.query_built and self.mode in ("RESULTS", "SEARCH"):
             line2 = f"Query: {self.query_built[:60]}   Root: {MEDIA_ROOT}"
         else:
             line2 = f"Root: {MEDIA_ROOT}   Staging: {STAGING_ROOT}"
-        self.safe_addstr(y, 0, line2[: max(0, w - 1)].ljust(max(0, w - 1)), curses.color_pair(3)); y += 1
+        self.safe_addstr(y, 0, line2[: max(0, w - 1)].ljust(max(0, w - 1)), self._attr_hint); y += 1
         return y
 
-    def get_menu_items(self) -> List[Tuple[str, str]]:
+    def _menu_fav_flag(self) -> bool:
         if self.mode in ("RESULTS", "SEARCH"):
-            fav_label = (
-                "Unfav" if (self.results and 0 <= self.sel_r < len(self.results)
-                            and self.is_fav_item(self.results[self.sel_r].identifier))
-                else "Fav"
+            return bool(
+                self.results and 0 <= self.sel_r < len(self.results)
+                and self.is_fav_item(self.results[self.sel_r].identifier)
             )
+        if self.mode == "FILES":
+            item = self.results[self.sel_r] if self.results else None
+            visible = self.get_visible_files()
+            sel = visible[self.sel_f] if (visible and 0 <= self.sel_f < len(visible)) else None
+            return bool(item and sel and self.is_fav_file(item.identifier, sel.name))
+        return False
+
+    def get_menu_items(self) -> List[Tuple[str, int, str]]:
+        # (pill, len(pill), action). Rebuilt only when something a label depends on changes;
+        # every such input is in the key, so mutators don't need to invalidate anything.
+        key = (
+            self.mode,
+            self.filter,
+            self.title_only,
+            self.enforce_license_gate,
+            self.last_bucket,
+            self.favs_tab,
+            self._menu_fav_flag(),
+        )
+        if self._menu_cache is not None and self._menu_cache[0] == key:
+            return self._menu_cache[1]
+        items = [(f"[ {label} ]", len(label) + 4, action) for label, action in self._build_menu_items(key[-1])]
+        self._menu_cache = (key, items)
+        return items
+
+    def _build_menu_items(self, fav: bool) -> List[Tuple[str, str]]:
+        if self.mode in ("RESULTS", "SEARCH"):
             return [
                 ("Search", "search"),
                 (f"Filter: {self.filter}", "filter"),
@@ -626,19 +1139,12 @@ class RetroWaveIA:
                 ("Prev", "prev_page"),
                 ("Next", "next_page"),
                 ("Open", "open"),
-                (fav_label, "fav_item"),
+                ("Unfav" if fav else "Fav", "fav_item"),
                 ("Favs", "favs"),
                 ("Help", "help"),
                 ("Quit", "quit"),
             ]
         if self.mode == "FILES":
-            item = self.results[self.sel_r] if self.results else None
-            visible = self.get_visible_files()
-            sel = visible[self.sel_f] if (visible and 0 <= self.sel_f < len(visible)) else None
-            is_f = False
-            if item and sel:
-                is_f = self.is_fav_file(item.identifier, sel.name)
-            fav_file_label = "Fav File" if not is_f else "Unfav File"
             return [
                 ("Back", "back"),
                 ("Keyword", "keyword"),
@@ -647,7 +1153,7 @@ class RetroWaveIA:
                 ("Item", "item"),
                 ("Download", "download"),
                 (f"Save to: {self.last_bucket}", "bucket"),
-                (fav_file_label, "fav_file"),
+                ("Unfav File" if fav else "Fav File", "fav_file"),
                 ("Favs", "favs"),
                 ("Help", "help"),
                 ("Quit", "quit"),
@@ -678,21 +1184,20 @@ class RetroWaveIA:
             return y
 
         x = 0
-        for i, (label, _action) in enumerate(items):
-            pill = f"[ {label} ]"
-            if x + len(pill) >= w - 1:
+        for i, (pill, plen, _action) in enumerate(items):
+            if x + plen >= w - 1:
                 break
 
             is_sel = (self.focus == "MENU" and i == self.menu_idx)
-            attr = curses.color_pair(2)
+            attr = self._attr_frame
             if is_sel:
-                attr = curses.color_pair(9) | curses.A_BOLD
+                attr = self._attr_sel_menu
 
             self.safe_addstr(y, x, pill, attr)
-            x += len(pill) + 1
+            x += plen + 1
 
         if x < w - 1:
-            self.safe_addstr(y, x, " " * (w - 1 - x), curses.color_pair(2))
+            self.safe_addstr(y, x, " " * (w - 1 - x), self._attr_frame)
 
         return y + 1
 
@@ -701,7 +1206,7 @@ class RetroWaveIA:
             return
 
         status = (self.status or "")[: max(0, w - 1)]
-        self.safe_addstr(h - 3, 0, status.ljust(max(0, w - 1)), curses.color_pair(6))
+        self.safe_addstr(h - 3, 0, status.ljust(max(0, w - 1)), self._attr_normal)
 
         if self.mode == "DOWNLOADING":
             keybar = "c cancels  |  q quits after cancel  |  (progress updates live)"
@@ -709,11 +1214,16 @@ class RetroWaveIA:
             keybar = "Arrows/Enter navigate  |  Tab menu/list  |  n/p or [ ] page  |  / search  |  q quit"
         else:
             keybar = "Arrows move  |  Tab switches menu/list  |  Enter selects  |  q quits"
-        self.safe_addstr(h - 2, 0, keybar[: max(0, w - 1)].ljust(max(0, w - 1)), curses.color_pair(2))
-        self.safe_addstr(h - 1, 0, ("═" * max(0, w - 1)), curses.color_pair(1))
+        key = (w, keybar)
+        if self._footer_cache is None or self._footer_cache[0] != key:
+            self._footer_cache = (key, keybar[: max(0, w - 1)].ljust(max(0, w - 1)), "═" * max(0, w - 1))
+        _key, bar, rule = self._footer_cache
+        self.safe_addstr(h - 2, 0, bar, self._attr_frame)
+        self.safe_addstr(h - 1, 0, rule, self._attr_accent)
 
     def prompt(self, label: str, default: str = "") -> Optional[str]:
         h, w = self.stdscr.getmaxyx()
+        self._frame_hw = (h, w)
         if h < 6 or w < 10:
             return None
 
@@ -722,8 +1232,8 @@ class RetroWaveIA:
         curses.curs_set(1)
         while True:
             bar = f"{label}{buf}"
-            self.safe_addstr(y, 0, " " * max(0, w - 1), curses.color_pair(8))
-            self.safe_addstr(y, 0, bar[: max(0, w - 1)], curses.color_pair(8))
+            self.safe_addstr(y, 0, " " * max(0, w - 1), self._attr_bar)
+            self.safe_addstr(y, 0, bar[: max(0, w - 1)], self._attr_bar)
             try:
                 self.stdscr.move(y, min(w - 2, len(label) + len(buf)))
             except curses.error:
@@ -750,6 +1260,7 @@ class RetroWaveIA:
             return None
 
         h, w = self.stdscr.getmaxyx()
+        self._frame_hw = (h, w)
         box_h = min(12, max(7, h - 6))
         box_w = min(w - 4, max(30, int(w * 0.85)))
         top = max(2, (h - box_h) // 2)
@@ -761,16 +1272,16 @@ class RetroWaveIA:
         self.stdscr.nodelay(False)
         while True:
             for y in range(top, top + box_h):
-                self.safe_addstr(y, left, " " * max(0, box_w), curses.color_pair(6))
+                self.safe_addstr(y, left, " " * max(0, box_w), self._attr_normal)
 
-            self.safe_addstr(top, left, "┌" + "─" * (box_w - 2) + "┐", curses.color_pair(2))
-            self.safe_addstr(top + box_h - 1, left, "└" + "─" * (box_w - 2) + "┘", curses.color_pair(2))
+            self.safe_addstr(top, left, "┌" + "─" * (box_w - 2) + "┐", self._attr_frame)
+            self.safe_addstr(top + box_h - 1, left, "└" + "─" * (box_w - 2) + "┘", self._attr_frame)
             for y in range(top + 1, top + box_h - 1):
-                self.safe_addstr(y, left, "│", curses.color_pair(2))
-                self.safe_addstr(y, left + box_w - 1, "│", curses.color_pair(2))
+                self.safe_addstr(y, left, "│", self._attr_frame)
+                self.safe_addstr(y, left + box_w - 1, "│", self._attr_frame)
 
             t = f" {title} "
-            self.safe_addstr(top, left + 2, t[: max(0, box_w - 4)], curses.color_pair(1) | curses.A_BOLD)
+            self.safe_addstr(top, left + 2, t[: max(0, box_w - 4)], self._attr_title)
 
             body_top = top + 2
             body_bottom = top + box_h - 2
@@ -787,12 +1298,12 @@ class RetroWaveIA:
                 line = f" {i+1:02d}. {s}"
                 line = line[: max(0, box_w - 2)].ljust(max(0, box_w - 2))
                 if i == idx:
-                    self.safe_addstr(row_y, left + 1, line, curses.color_pair(9) | curses.A_BOLD)
+                    self.safe_addstr(row_y, left + 1, line, self._attr_sel_menu)
                 else:
-                    self.safe_addstr(row_y, left + 1, line, curses.color_pair(6))
+                    self.safe_addstr(row_y, left + 1, line, self._attr_normal)
 
             hint = "Up/Down choose  Enter select  Esc cancel"
-            self.safe_addstr(top + box_h - 1, left + 2, hint[: max(0, box_w - 4)], curses.color_pair(3))
+            self.safe_addstr(top + box_h - 1, left + 2, hint[: max(0, box_w - 4)], self._attr_hint)
 
             self.stdscr.refresh()
             ch = self.stdscr.getch()
@@ -808,8 +1319,8 @@ class RetroWaveIA:
 
     # ---------- logic ----------
     def cycle_filter(self) -> None:
-        idx = FILTERS.index(self.filter) if self.filter in FILTERS else 0
-        self.filter = FILTERS[(idx + 1) % len(FILTERS)]
+        # An unknown value cycles as if it were the first entry.
+        self.filter = _FILTER_NEXT.get(self.filter, FILTERS[1])
         self.status = f"Filter set to: {self.filter}"
 
     def do_search(self, reset_page: bool = True) -> None:
@@ -823,7 +1334,7 @@ class RetroWaveIA:
         self.status = "Searching..."
         self.render()
 
-        self.results, self.total_results, err = ia_search_via_curl(self.query_built, rows=ROWS_PER_PAGE, page=self.page)
+        self.results, self.total_results, err = ia_search(self.query_built, rows=ROWS_PER_PAGE, page=self.page)
         if err:
             self.status = err
             return
@@ -831,6 +1342,7 @@ class RetroWaveIA:
         self.sel_r = 0
         self.mode = "RESULTS"
         self.focus = "LIST"
+        self.prefetch_metadata()
         if self.total_results > 0:
             total_pages = max(1, (self.total_results + ROWS_PER_PAGE - 1) // ROWS_PER_PAGE)
             self.status = f"Page {self.page}/{total_pages} — {self.total_results} total results. Arrows to select, Enter to open."
@@ -872,6 +1384,29 @@ class RetroWaveIA:
         self.focus = saved_focus
         self.menu_idx = saved_menu_idx
 
+    def metadata_future(self, identifier: str, now: bool = False) -> Future:
+        # now: the caller is about to block on the result. If it isn't running yet, fetch it
+        # on this thread instead of waiting behind queued prefetches.
+        fut = self._meta_cache.get(identifier)
+        if fut is not None and not (now and fut.cancel()):
+            self._meta_cache.move_to_end(identifier)
+            return fut
+        if now:
+            fut = Future()
+            fut.set_result(ia_metadata_json(identifier))
+        else:
+            fut = self._meta_pool.submit(ia_metadata_json, identifier)
+        self._meta_cache[identifier] = fut
+        self._meta_cache.move_to_end(identifier)
+        while len(self._meta_cache) > META_CACHE_MAX:
+            _ident, old = self._meta_cache.popitem(last=False)
+            old.cancel()
+        return fut
+
+    def prefetch_metadata(self) -> None:
+        for r in self.results[:META_PREFETCH_N]:
+            self.metadata_future(r.identifier)
+
     def load_files(self) -> None:
         if not self.results:
             self.status = "No results to open."
@@ -880,34 +1415,66 @@ class RetroWaveIA:
         self.status = f"Loading files for {item.identifier}..."
         self.render()
 
-        files, meta, err = ia_files(item.identifier)
+        meta, err = self.metadata_future(item.identifier, now=True).result()
+        files, meta, err = files_from_meta(meta, err)
         if err:
+            # Don't keep a failed fetch around; the next Enter retries it.
+            self._meta_cache.pop(item.identifier, None)
             self.status = err
             return
 
         self.cur_meta = meta
         self.files = files
+        self._sorted_files = sorted(files, key=attrgetter("name"))
+        self._sorted_names = [f.name for f in self._sorted_files]
         self.file_kw = ""
         self.sel_f = 0
         self.mode = "FILES"
         self.focus = "LIST"
         self.status = "Use arrows to choose a file, then [Preview], [Folder], [Item], or [Download]."
 
+    def license_status(self) -> Tuple[bool, str]:
+        # The FILES details panel asks every frame; the answer only changes with cur_meta,
+        # which load_files replaces rather than mutates.
+        meta = self.cur_meta
+        if not meta:
+            return False, "No metadata loaded"
+        cache = self._license_cache
+        if cache is not None and cache[0] is meta:
+            return cache[1]
+        result = is_openly_licensed(meta)
+        self._license_cache = (meta, result)
+        return result
+
     def get_visible_files(self) -> List[IAFile]:
-        files = list(self.files)
-        kw = self.file_kw.strip()
+        # Called several times per frame; reuse the last result while neither the file
+        # list (replaced, never mutated in place) nor the keyword has changed.
+        # Callers must not mutate the returned list.
+        cache = self._vf_cache
+        if cache is not None and cache[0] is self.files and cache[1] == self.file_kw:
+            return cache[2]
+        kw = self.file_kw.strip().lower()
         if kw:
-            rx = re.compile(re.escape(kw), re.IGNORECASE)
-            files = [f for f in files if rx.search(f.name) or rx.search(f.fmt)]
+            # The keyword is a literal, so a lowercase substring test does what an escaped
+            # IGNORECASE regex did, without the regex engine.
+            files = [f for f in self.files if kw in f.name.lower() or kw in f.fmt.lower()]
+        else:
+            files = self.files
+        self._vf_cache = (self.files, self.file_kw, files)
         return files
 
+    def visible_total(self, visible: List[IAFile]) -> int:
+        # get_visible_files hands back the same list until files/keyword change, so its
+        # total only needs summing once per list.
+        cache = self._visible_total_cache
+        if cache is not None and cache[0] is visible:
+            return cache[1]
+        total = sum(f.size for f in visible)
+        self._visible_total_cache = (visible, total)
+        return total
+
     def cycle_bucket(self) -> None:
-        order = ["TV", "Movies", "Other"]
-        try:
-            i = order.index(self.last_bucket)
-        except Exception:
-            i = 0
-        self.last_bucket = order[(i + 1) % len(order)]
+        self.last_bucket = _BUCKET_NEXT.get(self.last_bucket, BUCKETS[1])
         self.status = f"Save bucket: {self.last_bucket}"
 
     def pick_folder_fav_if_requested(self, bucket: str) -> Optional[str]:
@@ -916,119 +1483,173 @@ class RetroWaveIA:
             return None
         return self.prompt_list(f"{bucket} favorites", [str(x) for x in opts if str(x).strip()])
 
+    def ensure_dir(self, d: str) -> None:
+        # makedirs stat-walks every component; skip it for directories already made this session.
+        if d not in self._known_dirs:
+            os.makedirs(d, exist_ok=True)
+            self._known_dirs.add(d)
+
+    def single_large_video_name(self) -> Optional[str]:
+        # Name of the item's only video >= LARGE_VIDEO_BYTES, or None if there are zero or several.
+        # Computed once per file list (self.files is replaced on load, never mutated in place).
+        cache = self._large_video_cache
+        if cache is not None and cache[0] is self.files:
+            return cache[1]
+        name: Optional[str] = None
+        try:
+            large = [f for f in self.files if is_video_file(f.name, f.fmt) and f.size >= LARGE_VIDEO_BYTES]
+            if len(large) == 1:
+                name = large[0].name or ""
+        except Exception:
+            name = None
+        self._large_video_cache = (self.files, name)
+        return name
+
     def choose_bucket_and_path(self, identifier: str, filename: str, item_title: str) -> str:
         staging_path = staging_file_path(identifier, filename)
         if not os.path.exists(staging_path):
             return f"Downloaded, but staging file not found: {staging_path}"
     
-        # --- helpers (local, minimal impact) ---
-        def has_year_hint(s: str) -> bool:
-            if not s:
-                return False
-            # common patterns: "(1993)", "1993", "- 1993 -"
-            return bool(re.search(r"\((19|20)\d{2}\)", s) or re.search(r"(19|20)\d{2}", s))
-    
-        def is_single_large_video(name: str) -> bool:
-            try:
-                video_files = [f for f in self.files if is_video_file(f.name, f.fmt)]
-                large_video_files = [f for f in video_files if int(f.size or 0) >= LARGE_VIDEO_BYTES]
-                return (len(large_video_files) == 1 and (large_video_files[0].name or "") == name)
-            except Exception:
-                return False
-    
-        ep = detect_sxxeyy(filename) or detect_sxxeyy(item_title)
+        plan = self.choose_bucket_once(item_title, filename)
+        if plan is None:
+            return f"Left in staging: {staging_path}"
+        return self.apply_plan(plan, identifier, filename, item_title)
     
-        # Start from last bucket, but allow smart overrides
-        bucket = self.last_bucket if self.last_bucket in ("TV", "Movies", "Other") else "Other"
+    def choose_bucket_once(self, item_title: str, sample_filename: str, batch: bool = False) -> Optional[BucketPlan]:
+        # Picks the bucket and asks the folder questions once; apply_plan reuses the answers.
+        # With batch=True (several files of one item) the per-file episode prompt is skipped.
+        ep = detect_sxxeyy(sample_filename) or detect_sxxeyy(item_title)
     
-        # If it clearly looks episodic, force TV regardless of last choice
+        # First signal wins, cheapest checks first; the file-list scan only runs when nothing else decided.
         if ep:
+            # Clearly episodic: TV regardless of last choice.
             bucket = "TV"
+        elif has_year_hint(sample_filename) or has_year_hint(item_title):
+            # Looks like a movie: Movies regardless of last choice.
+            bucket = "Movies"
+        elif self.single_large_video_name() == sample_filename:
+            # The item's one big video file, with no SxxEyy: also a movie.
+            bucket = "Movies"
         else:
-            # If it looks like a movie, force Movies regardless of last choice
-            # (year hint OR single large video file with no SxxEyy)
-            if has_year_hint(filename) or has_year_hint(item_title) or is_single_large_video(filename):
-                bucket = "Movies"
+            # Otherwise stay with the last bucket.
+            bucket = self.last_bucket if self.last_bucket in ("TV", "Movies", "Other") else "Other"
     
         if bucket == "TV":
             show_default = sanitize_folder(item_title)
             show = self.prompt('Show name (Enter default, or type "*" for favorites): ', show_default)
             if show is None:
-                return f"Left in staging: {staging_path}"
+                return None
             if show.strip() == "*":
                 pick = self.pick_folder_fav_if_requested("TV")
                 show = pick if pick else show_default
-            show = sanitize_folder(show)
+            if show != show_default:
+                # Defaults come out of sanitize_folder already; only typed or picked names need it.
+                show = sanitize_folder(show)
             self.add_folder_fav("TV", show)
     
             # If we detected SxxEyy, do not ask season/episode questions
             if ep:
-                season, episode = ep
-                episode_override: Optional[int] = None
-            else:
-                s = self.prompt("Season number (01..): ", "01")
-                if s is None:
-                    return f"Left in staging: {staging_path}"
-                try:
-                    season = int(s)
-                except Exception:
-                    season = 1
+                return BucketPlan("TV", show, ep[0])
+            s = self.prompt("Season number (01..): ", "01")
+            if s is None:
+                return None
+            try:
+                season = int(s)
+            except Exception:
+                season = 1
+            episode_override: Optional[int] = None
+            if not batch:
                 e = self.prompt("Episode number (01.., blank = keep name): ", "")
                 if e is None:
-                    return f"Left in staging: {staging_path}"
+                    return None
                 try:
                     episode_override = int(e) if e.strip() else None
                 except Exception:
                     episode_override = None
+            return BucketPlan("TV", show, season, episode_override)
     
-            season_dir = os.path.join(BUCKET_TV, show, f"Season {season:02d}")
-            os.makedirs(season_dir, exist_ok=True)
-    
-            new_name = filename
-            if ep or episode_override is not None:
-                ext = os.path.splitext(filename)[1] or ".mp4"
-                ep_num = ep[1] if ep else (episode_override if episode_override is not None else 1)
-                new_name = f"{show} - S{season:02d}E{ep_num:02d}{ext}"
-    
-            final_path = os.path.join(season_dir, new_name)
-    
-        elif bucket == "Movies":
-            title_default = auto_clean_movie_folder_name(item_title, filename)
+        if bucket == "Movies":
+            title_default = auto_clean_movie_folder_name(item_title, sample_filename)
             movie = self.prompt('Movie folder (Enter default, or type "*" for favorites): ', title_default)
             if movie is None:
-                return f"Left in staging: {staging_path}"
+                return None
             if movie.strip() == "*":
                 pick = self.pick_folder_fav_if_requested("Movies")
                 movie = pick if pick else title_default
-            movie = sanitize_folder(movie)
+            if movie != title_default:
+                movie = sanitize_folder(movie)
             self.add_folder_fav("Movies", movie)
+            return BucketPlan("Movies", movie)
     
-            movie_dir = os.path.join(BUCKET_MOVIES, movie)
-            os.makedirs(movie_dir, exist_ok=True)
-            final_path = os.path.join(movie_dir, filename)
-    
-        else:
-            sub = self.prompt('Other subfolder (Enter "Misc", or type "*" for favorites): ', "Misc")
-            if sub is None:
-                return f"Left in staging: {staging_path}"
-            if sub.strip() == "*":
-                pick = self.pick_folder_fav_if_requested("Other")
-                sub = pick if pick else "Misc"
+        sub = self.prompt('Other subfolder (Enter "Misc", or type "*" for favorites): ', "Misc")
+        if sub is None:
+            return None
+        if sub.strip() == "*":
+            pick = self.pick_folder_fav_if_requested("Other")
+            sub = pick if pick else "Misc"
+        if sub != "Misc":
             sub = sanitize_folder(sub)
-            self.add_folder_fav("Other", sub)
+        self.add_folder_fav("Other", sub)
+        return BucketPlan("Other", sub)
+    
+    def apply_plan(
+        self, plan: BucketPlan, identifier: str, filename: str, item_title: str, stamp: Optional[str] = None
+    ) -> str:
+        # No prompts here: only the per-file SxxEyy check and the move.
+        staging_path = staging_file_path(identifier, filename)
+    
+        if plan.bucket == "TV":
+            ep = detect_sxxeyy(filename) or detect_sxxeyy(item_title)
+            season = ep[0] if ep else plan.season
+            dest_dir = os.path.join(BUCKET_TV, plan.folder, f"Season {season:02d}")
+            self.ensure_dir(dest_dir)
     
-            other_dir = os.path.join(BUCKET_OTHER, sub)
-            os.makedirs(other_dir, exist_ok=True)
-            final_path = os.path.join(other_dir, filename)
+            new_name = filename
+            if ep or plan.episode is not None:
+                ext = os.path.splitext(filename)[1] or ".mp4"
+                ep_num = ep[1] if ep else plan.episode
+                new_name = f"{plan.folder} - S{season:02d}E{ep_num:02d}{ext}"
     
-        if os.path.exists(final_path):
-            base, ext = os.path.splitext(final_path)
-            stamp = time.strftime("%Y%m%d_%H%M%S")
-            final_path = f"{base}_{stamp}{ext}"
+            final_path = os.path.join(dest_dir, new_name)
     
-        shutil.move(staging_path, final_path)
+        else:
+            dest_dir = os.path.join(BUCKET_MOVIES if plan.bucket == "Movies" else BUCKET_OTHER, plan.folder)
+            self.ensure_dir(dest_dir)
+            final_path = os.path.join(dest_dir, filename)
+    
+        try:
+            final_path = move_no_clobber(staging_path, final_path, stamp)
+        except FileNotFoundError:
+            # ensure_dir remembers folders it made; this one was removed outside the app since.
+            self._known_dirs.discard(dest_dir)
+            self.ensure_dir(dest_dir)
+            final_path = move_no_clobber(staging_path, final_path, stamp)
         return f"Saved: {final_path}"
     
+    def import_downloaded(self, item: SearchResult, files: List[IAFile]) -> None:
+        # Several files of one item: ask where they go once, then move each.
+        present = []
+        for f in files:
+            staging_path = staging_file_path(item.identifier, f.name)
+            if os.path.exists(staging_path):
+                present.append(f)
+            else:
+                self.download_log.appendleft(f"Downloaded, but staging file not found: {staging_path}")
+        if not present:
+            return
+    
+        plan = self.choose_bucket_once(item.title, present[0].name, batch=len(present) > 1)
+        # One clash suffix for the whole batch, so renamed files line up.
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        for f in present:
+            if plan is None:
+                msg = f"Left in staging: {staging_file_path(item.identifier, f.name)}"
+            else:
+                msg = self.apply_plan(plan, item.identifier, f.name, item.title, stamp)
+            self.download_log.appendleft(msg)
+            self.status = msg
+            self.render()
+    
     def set_preview_for_selected(self) -> None:
         if not self.results:
             self.status = "No item selected."
@@ -1040,13 +1661,13 @@ class RetroWaveIA:
             return
         f = visible[self.sel_f]
 
-        meta = self.cur_meta or {}
-        ok, why = is_openly_licensed(meta) if meta else (False, "No metadata loaded")
+        ok, why = self.license_status()
 
         self.preview_item = item
         self.preview_file = f
         self.preview_files = []
         self.preview_prefix = ""
+        self.preview_total = f.size
         if ok:
             self.preview_msg = "Open license detected in metadata. You can download after confirmation."
         else:
@@ -1064,8 +1685,7 @@ class RetroWaveIA:
             self.status = "No item selected."
             return
         item = self.results[self.sel_r]
-        meta = self.cur_meta or {}
-        ok, why = is_openly_licensed(meta) if meta else (False, "No metadata loaded")
+        ok, why = self.license_status()
 
         prefix = self.prompt("Folder/prefix to download (matches start of filename): ", "")
         if prefix is None:
@@ -1076,17 +1696,24 @@ class RetroWaveIA:
             self.status = "No prefix provided."
             return
 
+        # Names starting with prefix form one contiguous run of the sorted index.
+        lo = bisect.bisect_left(self._sorted_names, prefix)
+        hi = bisect.bisect_left(self._sorted_names, prefix + "\U0010ffff", lo)
+        matches = self._sorted_files[lo:hi]
         visible = self.get_visible_files()
-        matches = [f for f in visible if (f.name or "").startswith(prefix)]
+        if visible is not self.files:
+            shown = {id(f) for f in visible}
+            matches = [f for f in matches if id(f) in shown]
         if not matches:
             self.status = f"No files match prefix: {prefix}"
             return
 
-        total = sum(int(f.size or 0) for f in matches)
+        total = sum(f.size for f in matches)
         self.preview_item = item
         self.preview_file = None
         self.preview_files = matches
         self.preview_prefix = prefix
+        self.preview_total = total
 
         if ok:
             self.preview_msg = f"Open license detected. Will download {len(matches)} files ({human_size(total)})."
@@ -1106,19 +1733,19 @@ class RetroWaveIA:
             self.status = "No item selected."
             return
         item = self.results[self.sel_r]
-        meta = self.cur_meta or {}
-        ok, why = is_openly_licensed(meta) if meta else (False, "No metadata loaded")
+        ok, why = self.license_status()
 
         visible = self.get_visible_files()
         if not visible:
             self.status = "No visible files."
             return
 
-        total = sum(int(f.size or 0) for f in visible)
+        total = self.visible_total(visible)
         self.preview_item = item
         self.preview_file = None
         self.preview_files = list(visible)
         self.preview_prefix = "__FULL_ITEM__"
+        self.preview_total = total
 
         if ok:
             self.preview_msg = f"Open license detected. Will download {len(visible)} visible files ({human_size(total)})."
@@ -1139,29 +1766,35 @@ class RetroWaveIA:
             args.append("--no-change-timestamp")
         return args
 
-    def _verify_expected_size(self, identifier: str, filename: str, expected_size: int) -> Tuple[bool, str]:
+    def _verify_expected_size(
+        self, identifier: str, filename: str, expected_size: int, actual: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        # actual: a size the caller already read from disk; stat the file only when it has none.
         if expected_size <= 0:
             return True, ""
-        p = staging_file_path(identifier, filename)
-        actual = safe_getsize(p)
+        if actual is None:
+            actual = safe_getsize(staging_file_path(identifier, filename))
         if actual != int(expected_size):
             return False, f"Size mismatch for {filename}: got {human_size(actual)} expected {human_size(int(expected_size))}"
         return True, ""
 
     def _download_one_with_progress(self, identifier: str, filename: str, expected_size: int) -> Tuple[bool, str]:
-        os.makedirs(STAGING_ROOT, exist_ok=True)
+        self.ensure_dir(STAGING_ROOT)
 
         cmd = ["ia", "download", identifier, filename, "--destdir", STAGING_ROOT] + self._ia_download_base_args()
-        log_line(f"DL_CMD: {' '.join(cmd)}")
+        waiter = ActivityWaiter()
+        output = StreamedOutput(waiter.wake)
         try:
-            p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            p, reader = run_cmd_stream(cmd, output, on_eof=waiter.wake)
         except Exception as e:
+            waiter.close()
             log_line(f"DL_POPEN_ERR: {e}")
             return False, f"download failed: {e}"
 
         start_t = time.time()
         last_t = start_t
         last_bytes = 0
+        last_render_t = 0.0
         self.dl_cancel_requested = False
 
         self.dl_current_name = filename
@@ -1170,81 +1803,118 @@ class RetroWaveIA:
         self.dl_speed_bps = 0.0
         self.dl_eta_s = 0.0
 
-        self.stdscr.nodelay(True)
-
-        while True:
-            rc = p.poll()
-            path = staging_file_path(identifier, filename)
-
-            written = safe_getsize(path)
-            self.dl_current_written = written
-
-            now = time.time()
-            dt = now - last_t
-            if dt >= 0.5:
-                delta = max(0, written - last_bytes)
-                self.dl_speed_bps = float(delta) / float(dt) if dt > 0 else 0.0
-                if self.dl_current_total > 0 and self.dl_speed_bps > 0:
-                    remain = max(0, self.dl_current_total - written)
-                    self.dl_eta_s = float(remain) / float(self.dl_speed_bps)
-                else:
-                    self.dl_eta_s = 0.0
-                last_t = now
-                last_bytes = written
-
-            ch = self.stdscr.getch()
-            if ch in (ord("c"), ord("C")):
-                self.dl_cancel_requested = True
-                try:
-                    p.terminate()
-                except Exception:
-                    pass
-
-            if self.dl_current_total > 0:
-                pct = int((written * 100) / self.dl_current_total) if self.dl_current_total else 0
-                sp = human_size(int(self.dl_speed_bps)) + "/s" if self.dl_speed_bps > 0 else "?/s"
-                eta = f"{int(self.dl_eta_s)}s" if self.dl_eta_s > 0 else "?"
-                self.status = f"{filename}  {pct}%  {human_size(written)}/{human_size(self.dl_current_total)}  {sp}  ETA {eta}  (c cancels)"
-            else:
-                self.status = f"{filename}  {human_size(written)} downloaded  (c cancels)"
-
-            self.render()
+        # getch never blocks here; the waiter does the pacing and says when a key is pending.
+        self.stdscr.timeout(0)
+        key_ready = False
 
-            if rc is not None:
-                out, err = p.communicate(timeout=2)
-                if err:
-                    log_line(f"DL_STDERR: {err.strip()[:2000]}")
-                if out:
-                    log_line(f"DL_STDOUT: {out.strip()[:2000]}")
+        path = staging_file_path(identifier, filename)
+        on_disk = 0
 
-                if self.dl_cancel_requested:
-                    return False, "Canceled."
-                if rc != 0:
-                    msg = (err or out or "").strip()
-                    return False, msg or f"download failed (code {rc})"
+        # Strings that only change with the total or at the 0.5s speed cadence, not per redraw.
+        total_str = human_size(self.dl_current_total)
+        sp = "?/s"
+        eta = "?"
 
-                ok_sz, msg_sz = self._verify_expected_size(identifier, filename, int(expected_size or 0))
-                if not ok_sz:
-                    return False, msg_sz
-                return True, ""
-
-            time.sleep(0.1)
-
-    def _download_glob_with_progress(self, identifier: str, glob_pat: str, expected_total: int) -> Tuple[bool, str]:
-        os.makedirs(STAGING_ROOT, exist_ok=True)
-        os.makedirs(staging_identifier_dir(identifier), exist_ok=True)
+        with waiter:
+            try:
+                while True:
+                    rc = p.poll()
+
+                    now = time.time()
+                    dt = now - last_t
+                    # Stat the file only at the 0.5s speed cadence; ticks in between reuse the last size.
+                    if dt >= 0.5:
+                        try:
+                            on_disk = os.stat(path).st_size
+                        except OSError:
+                            on_disk = 0
+
+                    # The file size is exact; ia's own counter covers the time before the file appears.
+                    written = max(on_disk, output.written)
+                    self.dl_current_written = written
+                    if self.dl_current_total <= 0 and output.total > 0:
+                        self.dl_current_total = output.total
+                        total_str = human_size(output.total)
+
+                    if dt >= 0.5:
+                        delta = max(0, written - last_bytes)
+                        self.dl_speed_bps = float(delta) / float(dt) if dt > 0 else 0.0
+                        if self.dl_current_total > 0 and self.dl_speed_bps > 0:
+                            remain = max(0, self.dl_current_total - written)
+                            self.dl_eta_s = float(remain) / float(self.dl_speed_bps)
+                        else:
+                            self.dl_eta_s = 0.0
+                        sp = human_size(int(self.dl_speed_bps)) + "/s" if self.dl_speed_bps > 0 else "?/s"
+                        eta = f"{int(self.dl_eta_s)}s" if self.dl_eta_s > 0 else "?"
+                        last_t = now
+                        last_bytes = written
+
+                    ch = self.stdscr.getch() if key_ready else -1
+                    canceled_now = ch in (ord("c"), ord("C")) and not self.dl_cancel_requested
+                    if canceled_now:
+                        self.dl_cancel_requested = True
+                        try:
+                            p.terminate()
+                        except Exception:
+                            pass
+
+                    # Output lines wake the loop far more often than that, so redraw at most every
+                    # 0.25s; only the process ending or a fresh cancel gets a frame straight away.
+                    if rc is not None or canceled_now or now - last_render_t >= 0.25:
+                        if self.dl_current_total > 0:
+                            pct = written * 100 // self.dl_current_total
+                            self.status = f"{filename}  {pct}%  {human_size(written)}/{total_str}  {sp}  ETA {eta}  (c cancels)"
+                        else:
+                            self.status = f"{filename}  {human_size(written)} downloaded  (c cancels)"
+
+                        self.render()
+                        last_render_t = now
+
+                    if rc is not None:
+                        reader.join(timeout=2)
+                        out = output.text()
+                        if out:
+                            log_line(f"DL_OUTPUT: {out[:2000]}")
+
+                        if self.dl_cancel_requested:
+                            return False, "Canceled."
+                        if rc != 0:
+                            msg = output.tail[-1] if output.tail else ""
+                            return False, msg or f"download failed (code {rc})"
+
+                        # A last tick that already saw the full size settles it; otherwise stat once more.
+                        expected_size = int(expected_size or 0)
+                        final_bytes = on_disk if on_disk == expected_size else None
+                        ok_sz, msg_sz = self._verify_expected_size(identifier, filename, expected_size, final_bytes)
+                        if not ok_sz:
+                            return False, msg_sz
+                        return True, ""
+
+                    # Wake on output, exit or a key press; the timeout keeps speed/ETA ticking.
+                    key_ready = waiter.wait(0.25)
+            finally:
+                self.stdscr.timeout(-1)
+
+    def _download_glob_with_progress(
+        self, identifier: str, glob_pat: str, expected_total: int, files: Optional[List[IAFile]] = None
+    ) -> Tuple[bool, str]:
+        self.ensure_dir(STAGING_ROOT)
+        self.ensure_dir(staging_identifier_dir(identifier))
 
         cmd = ["ia", "download", identifier, "--destdir", STAGING_ROOT, "--glob", glob_pat] + self._ia_download_base_args()
-        log_line(f"DL_GLOB_CMD: {' '.join(cmd)}")
+        waiter = ActivityWaiter()
+        output = StreamedOutput(waiter.wake)
         try:
-            p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            p, reader = run_cmd_stream(cmd, output, on_eof=waiter.wake)
         except Exception as e:
+            waiter.close()
             log_line(f"DL_GLOB_POPEN_ERR: {e}")
             return False, f"download failed: {e}"
 
         start_t = time.time()
         last_t = start_t
         last_bytes = 0
+        last_render_t = 0.0
         self.dl_cancel_requested = False
 
         self.dl_current_name = f"--glob {glob_pat}"
@@ -1253,62 +1923,198 @@ class RetroWaveIA:
         self.dl_speed_bps = 0.0
         self.dl_eta_s = 0.0
 
-        self.stdscr.nodelay(True)
+        # getch never blocks here; the waiter does the pacing and says when a key is pending.
+        self.stdscr.timeout(0)
+        key_ready = False
 
         base_dir = staging_identifier_dir(identifier)
+        expected = {staging_file_path(identifier, f.name): f.size for f in files or []}
+        finished: Dict[str, int] = {}
 
-        while True:
-            rc = p.poll()
-
-            written = dir_total_size(base_dir)
-            self.dl_current_written = written
-
-            now = time.time()
-            dt = now - last_t
-            if dt >= 0.5:
-                delta = max(0, written - last_bytes)
-                self.dl_speed_bps = float(delta) / float(dt) if dt > 0 else 0.0
-                if self.dl_current_total > 0 and self.dl_speed_bps > 0:
-                    remain = max(0, self.dl_current_total - written)
-                    self.dl_eta_s = float(remain) / float(self.dl_speed_bps)
+        written = 0
+
+        # Strings that only change with the total or at the 0.5s speed cadence, not per redraw.
+        total_str = human_size(self.dl_current_total)
+        sp = "?/s"
+        eta = "?"
+
+        with waiter:
+            try:
+                while True:
+                    rc = p.poll()
+
+                    now = time.time()
+                    dt = now - last_t
+                    if dt >= 0.5:
+                        # Walking the staging tree is the expensive part; do it only at the speed cadence.
+                        written = dir_total_size(base_dir, expected, finished)
+                        self.dl_current_written = written
+                        delta = max(0, written - last_bytes)
+                        self.dl_speed_bps = float(delta) / float(dt) if dt > 0 else 0.0
+                        if self.dl_current_total > 0 and self.dl_speed_bps > 0:
+                            remain = max(0, self.dl_current_total - written)
+                            self.dl_eta_s = float(remain) / float(self.dl_speed_bps)
+                        else:
+                            self.dl_eta_s = 0.0
+                        sp = human_size(int(self.dl_speed_bps)) + "/s" if self.dl_speed_bps > 0 else "?/s"
+                        eta = f"{int(self.dl_eta_s)}s" if self.dl_eta_s > 0 else "?"
+                        last_t = now
+                        last_bytes = written
+
+                    ch = self.stdscr.getch() if key_ready else -1
+                    canceled_now = ch in (ord("c"), ord("C")) and not self.dl_cancel_requested
+                    if canceled_now:
+                        self.dl_cancel_requested = True
+                        try:
+                            p.terminate()
+                        except Exception:
+                            pass
+
+                    # Output lines wake the loop far more often than that, so redraw at most every
+                    # 0.25s; only the process ending or a fresh cancel gets a frame straight away.
+                    if rc is not None or canceled_now or now - last_render_t >= 0.25:
+                        if self.dl_current_total > 0:
+                            pct = written * 100 // self.dl_current_total
+                            self.status = f"{identifier}  {pct}%  {human_size(written)}/{total_str}  {sp}  ETA {eta}  (c cancels)"
+                        else:
+                            self.status = f"{identifier}  {human_size(written)} downloaded  (c cancels)"
+
+                        self.render()
+                        last_render_t = now
+
+                    if rc is not None:
+                        reader.join(timeout=2)
+                        out = output.text()
+                        if out:
+                            log_line(f"DL_GLOB_OUTPUT: {out[:2000]}")
+
+                        if self.dl_cancel_requested:
+                            return False, "Canceled."
+                        if rc != 0:
+                            msg = output.tail[-1] if output.tail else ""
+                            return False, msg or f"download failed (code {rc})"
+                        # Files the polling already saw at their expected size need no second stat.
+                        for f in files or []:
+                            path = staging_file_path(identifier, f.name)
+                            ok_sz, msg_sz = self._verify_expected_size(identifier, f.name, f.size, finished.get(path))
+                            if not ok_sz:
+                                return False, msg_sz
+                        return True, ""
+
+                    # Wake on output, exit or a key press; the timeout keeps speed/ETA ticking.
+                    key_ready = waiter.wait(0.25)
+            finally:
+                self.stdscr.timeout(-1)
+
+    def _on_bytes(self, n: int) -> None:
+        # Called from download workers.
+        with self._dl_lock:
+            self.dl_overall_written += n
+            now = time.monotonic()
+            dt = now - self._dl_rate_t
+            if dt >= 0.25:
+                rate = (self.dl_overall_written - self._dl_rate_bytes) / dt
+                if self.dl_speed_bps <= 0:
+                    self.dl_speed_bps = rate
                 else:
-                    self.dl_eta_s = 0.0
-                last_t = now
-                last_bytes = written
+                    alpha = 1.0 - math.exp(-dt / SPEED_EWMA_S)
+                    self.dl_speed_bps += alpha * (rate - self.dl_speed_bps)
+                self._dl_rate_t = now
+                self._dl_rate_bytes = self.dl_overall_written
+
+    def download_files(self, identifier: str, files: List[IAFile]) -> Tuple[bool, str, List[IAFile]]:
+        # Download several files concurrently into staging; progress is tracked over the whole set.
+        # Also returns the files that arrived complete, so they can be imported even after a failure.
+        self.ensure_dir(STAGING_ROOT)
+        cancel = threading.Event()
+        self.dl_cancel_requested = False
+        with self._dl_lock:
+            self.dl_overall_total = sum(f.size for f in files)
+            self.dl_overall_written = 0
+            self.dl_speed_bps = 0.0
+            self._dl_rate_t = time.monotonic()
+            self._dl_rate_bytes = 0
+        self.dl_eta_s = 0.0
+        workers = max(1, min(self.dl_max_workers, len(files)))
+        self.dl_current_name = files[0].name if len(files) == 1 else f"{len(files)} files, {workers} at a time"
+        self.dl_current_total = self.dl_overall_total
+        self.dl_current_written = 0
 
-            ch = self.stdscr.getch()
-            if ch in (ord("c"), ord("C")):
-                self.dl_cancel_requested = True
-                try:
-                    p.terminate()
-                except Exception:
-                    pass
+        # getch paces the loop: it returns on a key press or after 250ms.
+        self.stdscr.timeout(250)
 
-            if self.dl_current_total > 0:
-                pct = int((written * 100) / self.dl_current_total) if self.dl_current_total else 0
-                sp = human_size(int(self.dl_speed_bps)) + "/s" if self.dl_speed_bps > 0 else "?/s"
-                eta = f"{int(self.dl_eta_s)}s" if self.dl_eta_s > 0 else "?"
-                self.status = f"{identifier}  {pct}%  {human_size(written)}/{human_size(self.dl_current_total)}  {sp}  ETA {eta}  (c cancels)"
-            else:
-                self.status = f"{identifier}  {human_size(written)} downloaded  (c cancels)"
+        err = ""
+        finished = 0
+        ok_futs = set()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                futs = {
+                    ex.submit(http_download, identifier, f.name, staging_file_path(identifier, f.name), self._on_bytes, cancel): f
+                    for f in files
+                }
+                pending = set(futs)
+                while pending:
+                    done, pending = wait(pending, timeout=0)
+                    for fut in done:
+                        finished += 1
+                        e = fut.exception()
+                        if e is None:
+                            ok_futs.add(fut)
+                        elif not err:
+                            err = str(e)
+                            log_line(f"DL_ERR: {futs[fut].name}: {e}")
+                            cancel.set()
+
+                    ch = self.stdscr.getch()
+                    if ch in (ord("c"), ord("C")):
+                        self.dl_cancel_requested = True
+                        cancel.set()
+
+                    with self._dl_lock:
+                        written = self.dl_overall_written
+                        speed = self.dl_speed_bps
+                    self.dl_current_written = written
+                    if self.dl_overall_total > 0 and speed > 0:
+                        self.dl_eta_s = float(max(0, self.dl_overall_total - written)) / speed
+                    else:
+                        self.dl_eta_s = 0.0
 
-            self.render()
+                    sp = human_size(int(speed)) + "/s" if speed > 0 else "?/s"
+                    if self.dl_overall_total > 0:
+                        pct = int((written * 100) / self.dl_overall_total)
+                        eta = f"{int(self.dl_eta_s)}s" if self.dl_eta_s > 0 else "?"
+                        self.status = f"{finished}/{len(files)} files  {pct}%  {human_size(written)}/{human_size(self.dl_overall_total)}  {sp}  ETA {eta}  (c cancels)"
+                    else:
+                        self.status = f"{finished}/{len(files)} files  {human_size(written)} downloaded  {sp}  (c cancels)"
 
-            if rc is not None:
-                out, err = p.communicate(timeout=2)
-                if err:
-                    log_line(f"DL_GLOB_STDERR: {err.strip()[:2000]}")
-                if out:
-                    log_line(f"DL_GLOB_STDOUT: {out.strip()[:2000]}")
+                    self.render()
+        finally:
+            self.stdscr.timeout(-1)
 
-                if self.dl_cancel_requested:
-                    return False, "Canceled."
-                if rc != 0:
-                    msg = (err or out or "").strip()
-                    return False, msg or f"download failed (code {rc})"
-                return True, ""
+        arrived = []
+        for fut, f in futs.items():
+            if fut not in ok_futs:
+                continue
+            ok_sz, msg_sz = self._verify_expected_size(identifier, f.name, f.size)
+            if ok_sz:
+                arrived.append(f)
+            elif not err:
+                err = msg_sz
+        if self.dl_cancel_requested:
+            return False, "Canceled.", arrived
+        if err:
+            return False, err, arrived
+        return True, "", arrived
 
-            time.sleep(0.1)
+    def _reset_preview_state(self, status: str) -> None:
+        # Back to the file list with no pending download plan.
+        self.mode = "FILES"
+        self.focus = "LIST"
+        self.preview_item = None
+        self.preview_file = None
+        self.preview_files = []
+        self.preview_prefix = ""
+        self.status = status
 
     def perform_download_plan(self) -> None:
         if not self.preview_item:
@@ -1317,8 +2123,7 @@ class RetroWaveIA:
             self.focus = "LIST"
             return
 
-        meta = self.cur_meta or {}
-        ok, why = is_openly_licensed(meta) if meta else (False, "No metadata loaded")
+        ok, why = self.license_status()
         if not ok and self.enforce_license_gate:
             self.status = f"Blocked. {why}"
             self.mode = "FILES"
@@ -1338,7 +2143,7 @@ class RetroWaveIA:
         # single file
         if self.preview_file:
             queue = [self.preview_file]
-            self.dl_overall_total = sum(int(f.size or 0) for f in queue)
+            self.dl_overall_total = self.preview_total
             self.dl_overall_written = 0
 
             self.mode = "DOWNLOADING"
@@ -1348,128 +2153,87 @@ class RetroWaveIA:
             self.status = f"Downloading: {f.name}"
             self.render()
 
-            ok2, err = self._download_one_with_progress(item.identifier, f.name, int(f.size or 0))
+            if http_pool() is not None:
+                ok2, err, _arrived = self.download_files(item.identifier, queue)
+            else:
+                ok2, err = self._download_one_with_progress(item.identifier, f.name, f.size)
             if not ok2:
-                self.mode = "FILES"
-                self.focus = "LIST"
-                self.preview_item = None
-                self.preview_file = None
-                self.preview_files = []
-                self.preview_prefix = ""
-                self.status = err
-                self.download_log.insert(0, f"Error: {err}")
-                self.download_log = self.download_log[:8]
+                self.download_log.appendleft(f"Error: {err}")
+                self._reset_preview_state(err)
                 return
 
             msg = self.choose_bucket_and_path(item.identifier, f.name, item.title)
-            self.download_log.insert(0, msg)
-            self.download_log = self.download_log[:8]
+            self.download_log.appendleft(msg)
             self.status = msg
             self.render()
 
-            self.mode = "FILES"
-            self.focus = "LIST"
-            self.preview_item = None
-            self.preview_file = None
-            self.preview_files = []
-            self.preview_prefix = ""
-            self.status = "Done. Downloaded 1 file."
+            self._reset_preview_state("Done. Downloaded 1 file.")
             return
 
         # prefix or full item
         if self.preview_files:
             queue = list(self.preview_files)
-            total_expected = sum(int(f.size or 0) for f in queue)
+            total_expected = self.preview_total
 
             self.mode = "DOWNLOADING"
             self.focus = "MENU"
 
             if self.preview_prefix and self.preview_prefix != "__FULL_ITEM__":
-                # Use ia --glob for prefix downloads.
-                # NOTE: IA globs are matched against the "name" field (including folder paths).
-                # Using prefix* matches "prefix..." including subpaths if prefix includes a folder/ path.
-                glob_pat = f"{self.preview_prefix}*"
-                self.status = f"Downloading prefix via --glob: {glob_pat}"
-                self.render()
-
-                ok2, err = self._download_glob_with_progress(item.identifier, glob_pat, int(total_expected))
+                if http_pool() is not None:
+                    # The matching files are already known; fetch exactly those over the shared pool.
+                    ok2, err, _arrived = self.download_files(item.identifier, queue)
+                else:
+                    # Use ia --glob for prefix downloads.
+                    # NOTE: IA globs are matched against the "name" field (including folder paths).
+                    # Using prefix* matches "prefix..." including subpaths if prefix includes a folder/ path.
+                    glob_pat = f"{self.preview_prefix}*"
+                    self.status = f"Downloading prefix via --glob: {glob_pat}"
+                    self.render()
+
+                    ok2, err = self._download_glob_with_progress(item.identifier, glob_pat, int(total_expected), queue)
                 if not ok2:
-                    self.mode = "FILES"
-                    self.focus = "LIST"
-                    self.preview_item = None
-                    self.preview_file = None
-                    self.preview_files = []
-                    self.preview_prefix = ""
-                    self.status = err
-                    self.download_log.insert(0, f"Error: {err}")
-                    self.download_log = self.download_log[:8]
+                    self.download_log.appendleft(f"Error: {err}")
+                    self._reset_preview_state(err)
                     return
 
-                # Import each expected file (now that the glob run finished).
-                for f in queue:
-                    ok_sz, msg_sz = self._verify_expected_size(item.identifier, f.name, int(f.size or 0))
-                    if not ok_sz:
-                        self.mode = "FILES"
-                        self.focus = "LIST"
-                        self.preview_item = None
-                        self.preview_file = None
-                        self.preview_files = []
-                        self.preview_prefix = ""
-                        self.status = msg_sz
-                        self.download_log.insert(0, f"Error: {msg_sz}")
-                        self.download_log = self.download_log[:8]
-                        return
-
-                    msg = self.choose_bucket_and_path(item.identifier, f.name, item.title)
-                    self.download_log.insert(0, msg)
-                    self.download_log = self.download_log[:8]
-                    self.status = msg
-                    self.render()
+                # Import each expected file (sizes were checked by the download itself).
+                self.import_downloaded(item, queue)
 
-                self.mode = "FILES"
-                self.focus = "LIST"
-                self.preview_item = None
-                self.preview_file = None
-                self.preview_files = []
-                self.preview_prefix = ""
-                self.status = f"Done. Downloaded {len(queue)} file(s)."
+                self._reset_preview_state(f"Done. Downloaded {len(queue)} file(s).")
                 return
 
-            # Full item (visible set). Sequential download keeps progress accurate per-file and imports cleanly.
-            for idx, f in enumerate(queue):
-                self.dl_current_name = f.name
-                self.dl_current_total = int(f.size or 0)
-                self.dl_current_written = 0
-
-                self.status = f"Downloading {idx+1}/{len(queue)}: {f.name}"
-                self.render()
-
-                ok2, err = self._download_one_with_progress(item.identifier, f.name, int(f.size or 0))
+            # Full item (visible set). With urllib3 the files download in parallel, otherwise
+            # sequentially via the ia CLI; either way they are imported once all of them are in.
+            if http_pool() is not None:
+                ok2, err, arrived = self.download_files(item.identifier, queue)
                 if not ok2:
-                    self.mode = "FILES"
-                    self.focus = "LIST"
-                    self.preview_item = None
-                    self.preview_file = None
-                    self.preview_files = []
-                    self.preview_prefix = ""
-                    self.status = err
-                    self.download_log.insert(0, f"Error: {err}")
-                    self.download_log = self.download_log[:8]
+                    # Still file away what did arrive before the failure.
+                    self.import_downloaded(item, arrived)
+                    self.download_log.appendleft(f"Error: {err}")
+                    self._reset_preview_state(err)
                     return
 
-                msg = self.choose_bucket_and_path(item.identifier, f.name, item.title)
-                self.download_log.insert(0, msg)
-                self.download_log = self.download_log[:8]
-                self.status = msg
-                self.render()
+                self.import_downloaded(item, queue)
+            else:
+                for idx, f in enumerate(queue):
+                    self.dl_current_name = f.name
+                    self.dl_current_total = f.size
+                    self.dl_current_written = 0
+
+                    self.status = f"Downloading {idx+1}/{len(queue)}: {f.name}"
+                    self.render()
 
-            self.mode = "FILES"
-            self.focus = "LIST"
-            self.preview_item = None
-            self.preview_file = None
-            self.preview_files = []
-            self.preview_prefix = ""
-            self.status = f"Done. Downloaded {len(queue)} file(s)."
+                    ok2, err = self._download_one_with_progress(item.identifier, f.name, f.size)
+                    if not ok2:
+                        # Still file away what did arrive before the failure.
+                        self.import_downloaded(item, queue[:idx])
+                        self.download_log.appendleft(f"Error: {err}")
+                        self._reset_preview_state(err)
+                        return
+
+                self.import_downloaded(item, queue)
+
+            self._reset_preview_state(f"Done. Downloaded {len(queue)} file(s).")
             return
 
         self.status = "Nothing selected."
@@ -1478,7 +2242,7 @@ class RetroWaveIA:
 
     # ---------- render ----------
     def draw_help(self, top_y: int) -> None:
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._frame_hw
         y = top_y
 
         lines = [
@@ -1506,11 +2270,11 @@ class RetroWaveIA:
         for line in lines:
             if y >= h - 4:
                 break
-            self.safe_addstr(y, 0, line[: max(0, w - 1)], curses.color_pair(6))
+            self.safe_addstr(y, 0, line[: max(0, w - 1)], self._attr_normal)
             y += 1
 
     def draw_welcome(self, top_y: int) -> None:
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._frame_hw
         lines = [
             "Welcome.",
             "",
@@ -1525,10 +2289,10 @@ class RetroWaveIA:
             if y >= h - 4:
                 break
             x = max(0, (w - len(line)) // 2)
-            self.safe_addstr(y, x, line[: max(0, w - 1)], curses.color_pair(6))
+            self.safe_addstr(y, x, line[: max(0, w - 1)], self._attr_normal)
 
     def draw_preview(self, top_y: int) -> None:
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._frame_hw
         y = top_y + 1
         item = self.preview_item
 
@@ -1551,7 +2315,7 @@ class RetroWaveIA:
                 "Confirm will download into staging, then prompt for naming and move into media folders.",
             ]
         elif item and self.preview_files:
-            total = sum(int(f.size or 0) for f in self.preview_files)
+            total = self.preview_total
             mode_label = "Full item (visible files)" if self.preview_prefix == "__FULL_ITEM__" else f"Folder/prefix: {self.preview_prefix}"
             lines += [
                 "Preview (no changes)",
@@ -1567,7 +2331,7 @@ class RetroWaveIA:
                 "First matches:",
             ]
             for f in self.preview_files[:10]:
-                lines.append(f"  {human_size(int(f.size or 0)):>9}  {f.name}")
+                lines.append(f"  {human_size(f.size):>9}  {f.name}")
             if len(self.preview_files) > 10:
                 lines.append(f"  ... and {len(self.preview_files) - 10} more")
             lines += ["", "Confirm will download, then import files into media folders."]
@@ -1577,11 +2341,71 @@ class RetroWaveIA:
         for line in lines:
             if y >= h - 4:
                 break
-            self.safe_addstr(y, 0, line[: max(0, w - 1)], curses.color_pair(6))
+            self.safe_addstr(y, 0, line[: max(0, w - 1)], self._attr_normal)
             y += 1
 
+    def _download_details(self) -> List[str]:
+        # Rebuilt once per DL_STATS_S; frames in between re-use the lines, so the numbers
+        # don't flicker with every chunk. Speed is an EMA over per-interval rates, not an
+        # all-time average, so the ETA follows the current speed.
+        now = time.monotonic()
+        name, written, total = self.dl_current_name, self.dl_current_written, self.dl_current_total
+        last_name, last_t, last_written = self._stats_last
+        if name != last_name or written < last_written:
+            # A new download: drop the old speed and sample now.
+            self._ema_bps = 0.0
+            self._stats_next_t = 0.0
+            self._stats_last = (name, now, written)
+        elif now < self._stats_next_t:
+            return self._dl_details_cache
+        else:
+            instant = (written - last_written) / (now - last_t) if now > last_t else 0.0
+            self._ema_bps = instant if self._ema_bps <= 0 else DL_STATS_EMA * instant + (1 - DL_STATS_EMA) * self._ema_bps
+            self._stats_last = (name, now, written)
+        self._stats_next_t = now + DL_STATS_S
+        # A stalled or steady download often samples to the same figures; keep those lines.
+        key = (name, written, total, int(self._ema_bps))
+        if key == self._dl_details_key:
+            return self._dl_details_cache
+        self._dl_details_key = key
+
+        details = [
+            "Download progress:",
+            f"  Target: {name}",
+        ]
+        if total > 0:
+            details += [f"  {written * 100 // total}%  {human_size(written)}/{human_size(total)}"]
+        else:
+            details += [f"  {human_size(written)} downloaded"]
+        if self._ema_bps > 0:
+            details += [f"  Speed: {human_size(int(self._ema_bps))}/s"]
+            if total > 0:
+                eta = min(DL_ETA_MAX_S, int(max(0, total - written) / self._ema_bps))
+                if eta > 0:
+                    details += [f"  ETA: {eta}s"]
+        details += ["", "Press c to cancel"]
+        self._dl_details_cache = details
+        return details
+
+    def _format_file_row(self, i: int, f: IAFile, selected: bool, is_fav: bool, row_w: int) -> str:
+        # Scrolling or moving the selection only changes a couple of rows; the rest come from here.
+        key = (i, f.name, f.size, selected, is_fav, row_w)
+        cache = self._row_cache
+        line = cache.get(key)
+        if line is not None:
+            cache.move_to_end(key)
+            return line
+        marker = ">" if selected else " "
+        star = "*" if is_fav else " "
+        line = f"{marker} {i+1:02d} {star} │ {human_size(f.size):>9}  {f.name}"
+        line = f"{line:<{row_w}.{row_w}}"
+        cache[key] = line
+        if len(cache) > ROW_CACHE_MAX:
+            cache.popitem(last=False)
+        return line
+
     def draw_panels(self, top_y: int) -> None:
-        h, w = self.stdscr.getmaxyx()
+        h, w = self._frame_hw
         body_top = top_y
         body_bottom = h - 4
         if body_bottom <= body_top + 2:
@@ -1596,9 +2420,11 @@ class RetroWaveIA:
             left_w = w - 2
         right_x = left_w + 1
         right_w = max(0, (w - right_x - 1))
+        # Width of a left-panel row; "{s:<{n}.{n}}" cuts and pads to n in one format op.
+        row_w = max(0, left_w - 1)
 
         for y in range(body_top, body_bottom):
-            self.safe_addstr(y, left_w, "│", curses.color_pair(1))
+            self.safe_addstr(y, left_w, "│", self._attr_accent)
 
         left_title = "RESULTS"
         if self.mode == "FILES":
@@ -1614,17 +2440,21 @@ class RetroWaveIA:
         elif self.mode == "PREVIEW_DL":
             left_title = "PREVIEW"
 
-        self.safe_addstr(body_top, 0, f" {left_title} ".ljust(max(0, left_w - 1), "─"), curses.color_pair(2))
-        self.safe_addstr(body_top, right_x, " DETAILS ".ljust(max(0, right_w), "─")[: max(0, right_w)], curses.color_pair(2))
+        self.safe_addstr(body_top, 0, f" {left_title} ".ljust(row_w, "─"), self._attr_frame)
+        self.safe_addstr(body_top, right_x, " DETAILS ".ljust(right_w, "─")[:right_w], self._attr_frame)
 
         list_top = body_top + 1
         max_rows = body_bottom - list_top
         if max_rows <= 0:
             return
+        # List rows are row_w wide at column 0 inside the body, so they're always on
+        # screen: they go straight into the frame's row buffer, skipping safe_addstr.
+        rows = self._frame_rows
+        row_attr = self._attr_normal
 
         if self.mode in ("RESULTS", "SEARCH"):
             if not self.results:
-                self.safe_addstr(list_top, 0, "Choose [Search] in the menu to begin.".ljust(max(0, left_w - 1)), curses.color_pair(6))
+                self.safe_addstr(list_top, 0, "Choose [Search] in the menu to begin.".ljust(row_w), self._attr_normal)
             else:
                 start_n = (self.page - 1) * ROWS_PER_PAGE + 1
                 end_n = (self.page - 1) * ROWS_PER_PAGE + len(self.results)
@@ -1633,12 +2463,13 @@ class RetroWaveIA:
                     phdr = f" Results {start_n}–{end_n} of {self.total_results}  (page {self.page}/{total_pages})  [ ] or n/p to page"
                 else:
                     phdr = f" Results {start_n}–{end_n}  (page {self.page})"
-                self.safe_addstr(list_top, 0, phdr[: max(0, left_w - 1)].ljust(max(0, left_w - 1)), curses.color_pair(3))
+                self.safe_addstr(list_top, 0, f"{phdr:<{row_w}.{row_w}}", self._attr_hint)
                 list_top += 1
                 max_rows = max(0, max_rows - 1)
                 start = 0
                 if self.sel_r >= max_rows:
                     start = self.sel_r - max_rows + 1
+                sel_attr = self._attr_sel_result if self.focus == "LIST" else row_attr
                 for i in range(start, min(len(self.results), start + max_rows)):
                     r = self.results[i]
                     marker = ">" if i == self.sel_r else " "
@@ -1648,20 +2479,14 @@ class RetroWaveIA:
                     year = f" ({r.year})" if r.year else ""
                     star = "*" if self.is_fav_item(r.identifier) else " "
                     line = f"{marker} {idx} {star} │ {title}{year}"
-                    line = line[: max(0, left_w - 1)].ljust(max(0, left_w - 1))
-
-                    if i == self.sel_r:
-                        attr = curses.color_pair(7) if self.focus == "LIST" else curses.color_pair(6)
-                        if self.focus == "LIST":
-                            attr |= curses.A_BOLD
-                        self.safe_addstr(list_top + (i - start), 0, line, attr)
-                    else:
-                        self.safe_addstr(list_top + (i - start), 0, line, curses.color_pair(6))
+                    line = f"{line:<{row_w}.{row_w}}"
+                    attr = sel_attr if i == self.sel_r else row_attr
+                    rows.setdefault(list_top + (i - start), []).append((0, line, attr))
 
         elif self.mode == "FILES":
             visible = self.get_visible_files()
             if not visible:
-                self.safe_addstr(list_top, 0, "No matching files. Use [Keyword].".ljust(max(0, left_w - 1)), curses.color_pair(6))
+                self.safe_addstr(list_top, 0, "No matching files. Use [Keyword].".ljust(row_w), self._attr_normal)
             else:
                 if self.sel_f >= len(visible):
                     self.sel_f = max(0, len(visible) - 1)
@@ -1669,22 +2494,16 @@ class RetroWaveIA:
                 if self.sel_f >= max_rows:
                     start = self.sel_f - max_rows + 1
                 item = self.results[self.sel_r] if self.results else None
+                # file_fav_key's prefix for this item, built once per frame rather than per row.
+                fav_prefix = self.file_fav_key(item.identifier, "") if item else None
+                fav_keys = self._fav_file_keys
+                sel_attr = self._attr_sel_file if self.focus == "LIST" else row_attr
                 for i in range(start, min(len(visible), start + max_rows)):
                     f = visible[i]
-                    marker = ">" if i == self.sel_f else " "
-                    star = " "
-                    if item and self.is_fav_file(item.identifier, f.name):
-                        star = "*"
-                    line = f"{marker} {i+1:02d} {star} │ {human_size(f.size):>9}  {f.name}"
-                    line = line[: max(0, left_w - 1)].ljust(max(0, left_w - 1))
-
-                    if i == self.sel_f:
-                        attr = curses.color_pair(8) if self.focus == "LIST" else curses.color_pair(6)
-                        if self.focus == "LIST":
-                            attr |= curses.A_BOLD
-                        self.safe_addstr(list_top + (i - start), 0, line, attr)
-                    else:
-                        self.safe_addstr(list_top + (i - start), 0, line, curses.color_pair(6))
+                    is_fav = fav_prefix is not None and (fav_prefix + f.name) in fav_keys
+                    line = self._format_file_row(i, f, i == self.sel_f, is_fav, row_w)
+                    attr = sel_attr if i == self.sel_f else row_attr
+                    rows.setdefault(list_top + (i - start), []).append((0, line, attr))
 
         ry = list_top
         details: List[str] = []
@@ -1732,53 +2551,88 @@ class RetroWaveIA:
                 ]
 
             if self.cur_meta:
-                ok2, why2 = is_openly_licensed(self.cur_meta)
+                ok2, why2 = self.license_status()
                 details += ["", "License gate:", f"  {'ALLOW' if ok2 else 'BLOCK'}", f"  {why2}"]
 
         elif self.mode == "DOWNLOADING":
-            details = [
-                "Download progress:",
-                f"  Target: {self.dl_current_name}",
-            ]
-            if self.dl_current_total > 0:
-                pct = int((self.dl_current_written * 100) / self.dl_current_total) if self.dl_current_total else 0
-                details += [
-                    f"  {pct}%  {human_size(self.dl_current_written)}/{human_size(self.dl_current_total)}",
-                ]
-            else:
-                details += [f"  {human_size(self.dl_current_written)} downloaded"]
-            if self.dl_speed_bps > 0:
-                details += [f"  Speed: {human_size(int(self.dl_speed_bps))}/s"]
-            if self.dl_eta_s > 0:
-                details += [f"  ETA: {int(self.dl_eta_s)}s"]
-            details += ["", "Press c to cancel"]
+            details = self._download_details()
 
         for line in details:
             if ry >= body_bottom:
                 break
-            self.safe_addstr(ry, right_x, line[: max(0, right_w)].ljust(max(0, right_w)), curses.color_pair(6))
+            self.safe_addstr(ry, right_x, f"{line:<{right_w}.{right_w}}", self._attr_normal)
             ry += 1
 
-        if right_w > 10 and self.download_log and self.mode != "FAVS":
-            ry2 = body_bottom - min(6, len(self.download_log) + 1)
+        log = self.download_log
+        if right_w > 10 and log and self.mode != "FAVS":
+            ry2 = body_bottom - (len(log) + 1)
             if ry2 > list_top + 2:
-                self.safe_addstr(ry2, right_x, " RECENT ".ljust(max(0, right_w), "─")[: max(0, right_w)], curses.color_pair(2))
+                self.safe_addstr(ry2, right_x, " RECENT ".ljust(right_w, "─")[:right_w], self._attr_frame)
                 ry2 += 1
-                for msg in self.download_log[:5]:
+                for msg in log:
                     if ry2 >= body_bottom:
                         break
-                    self.safe_addstr(ry2, right_x, msg[: max(0, right_w)].ljust(max(0, right_w)), curses.color_pair(6))
+                    self.safe_addstr(ry2, right_x, f"{msg:<{right_w}.{right_w}}", self._attr_normal)
                     ry2 += 1
 
+    def _flush_rows(self) -> None:
+        # Repaint only rows whose writes differ from the last frame; clear rows it no longer uses.
+        rows, drawn = self._frame_rows or {}, self._drawn_rows
+        for y, writes in rows.items():
+            if drawn.get(y) == writes:
+                continue
+            try:
+                x, s, attr = writes[0]
+                if x == 0:
+                    # Most rows start at column 0: write first, then clear only what's left.
+                    self.stdscr.addstr(y, 0, s, attr)
+                    self.stdscr.clrtoeol()
+                else:
+                    self.stdscr.move(y, 0)
+                    self.stdscr.clrtoeol()
+                    self.stdscr.addstr(y, x, s, attr)
+                for x, s, attr in writes[1:]:
+                    self.stdscr.addstr(y, x, s, attr)
+            except curses.error:
+                pass
+        for y in drawn.keys() - rows.keys():
+            try:
+                self.stdscr.move(y, 0)
+                self.stdscr.clrtoeol()
+            except curses.error:
+                pass
+        self._drawn_rows = rows
+
     def render(self) -> None:
-        self.stdscr.erase()
+        self._last_render = time.monotonic()
         h, w = self.stdscr.getmaxyx()
-
-        if self.term_too_small():
-            self.safe_addstr(0, 0, "Terminal too small.", curses.color_pair(5) | curses.A_BOLD)
-            self.safe_addstr(2, 0, f"Need at least {MIN_W}x{MIN_H}. Current: {w}x{h}", curses.color_pair(6))
-            self.safe_addstr(4, 0, "Resize your terminal window.", curses.color_pair(6))
-            self.stdscr.refresh()
+        too_small = h < MIN_H or w < MIN_W
+        if too_small and self._too_small_shown and (h, w) == self._drawn_hw and None not in self._drawn_rows.values():
+            # The notice depends only on the size, and it's already on screen at this size.
+            return
+        self._frame_hw = (h, w)
+        if (h, w) != self._drawn_hw:
+            # New size: nothing on screen can be trusted.
+            self.stdscr.erase()
+            self._drawn_rows = {}
+            self._drawn_hw = (h, w)
+
+        self._frame_rows = {}
+        try:
+            self._draw_frame(h, w, too_small)
+            self._flush_rows()
+        finally:
+            self._frame_rows = None
+        self._too_small_shown = too_small
+        # Stage the frame and send it in one terminal update.
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+
+    def _draw_frame(self, h: int, w: int, too_small: bool) -> None:
+        if too_small:
+            self.safe_addstr(0, 0, "Terminal too small.", self._attr_err_bold)
+            self.safe_addstr(2, 0, f"Need at least {MIN_W}x{MIN_H}. Current: {w}x{h}", self._attr_normal)
+            self.safe_addstr(4, 0, "Resize your terminal window.", self._attr_normal)
             return
 
         y = self.draw_banner(w)
@@ -1786,7 +2640,7 @@ class RetroWaveIA:
         y = self.draw_menu_bar(y, w)
 
         if self.mode == "ERROR":
-            self.safe_addstr(y + 1, 0, ("ERROR: " + self.status)[: max(0, w - 1)], curses.color_pair(5))
+            self.safe_addstr(y + 1, 0, ("ERROR: " + self.status)[: max(0, w - 1)], self._attr_err)
         elif self.mode == "HELP":
             self.draw_help(y)
         elif self.mode == "PREVIEW_DL":
@@ -1797,173 +2651,185 @@ class RetroWaveIA:
             self.draw_panels(y)
 
         self.draw_footer(h, w)
-        self.stdscr.refresh()
 
     # ---------- menu actions ----------
     def activate_menu_action(self, action: str) -> None:
-        if action == "quit":
-            self.exit_requested = True
-            return
-
-        if action == "help":
-            self.mode = "HELP" if self.mode != "HELP" else ("FILES" if self.files else "RESULTS")
-            self.focus = "MENU"
-            self.menu_idx = 0
-            self.status = "Help" if self.mode == "HELP" else "Back"
-            return
-
-        if action == "favs":
-            self.mode = "FAVS"
-            self.focus = "LIST"
-            self.menu_idx = 0
-            self.favs_idx = 0
-            if self.favs_tab not in ("ITEMS", "FILES", "FOLDERS"):
-                self.favs_tab = "ITEMS"
-            self.status = "Favorites. Use Tab for menu, or arrows for list."
-            return
-
-        if action == "license_gate":
-            self.enforce_license_gate = not self.enforce_license_gate
-            self.status = "License gate: ON (blocks unclear rights)" if self.enforce_license_gate else "License gate: OFF (warns only)"
-            return
+        handler = self._actions.get((self.mode, action)) or self._actions.get(action)
+        if handler is not None:
+            handler()
+
+    def _build_actions(self) -> Dict[Any, Callable[[], None]]:
+        # Menu action -> handler. Plain keys work in any mode; (mode, action) keys only in that mode.
+        actions: Dict[Any, Callable[[], None]] = {
+            "quit": self._act_quit,
+            "help": self._act_help,
+            "favs": self._act_favs,
+            "license_gate": self._act_license_gate,
+            ("FILES", "back"): self._act_back_to_results,
+            ("HELP", "back"): self._act_back,
+            ("FAVS", "back"): self._act_back,
+            ("FILES", "keyword"): self._act_keyword,
+            ("FILES", "bucket"): self.cycle_bucket,
+            ("FILES", "preview"): self.set_preview_for_selected,
+            ("FILES", "folder"): self.set_preview_for_prefix,
+            ("FILES", "item"): self.set_preview_for_item,
+            ("FILES", "download"): self.set_preview_for_selected,
+            ("FILES", "fav_file"): self._act_fav_file,
+            ("PREVIEW_DL", "confirm_download"): self.perform_download_plan,
+            ("PREVIEW_DL", "cancel_preview"): self._act_cancel_preview,
+            ("FAVS", "tab"): self._act_favs_tab,
+            ("FAVS", "remove"): self._act_favs_remove,
+            ("FAVS", "primary"): self._act_favs_primary,
+        }
+        for mode in ("RESULTS", "SEARCH"):
+            actions.update({
+                (mode, "search"): self._act_search,
+                (mode, "filter"): self.cycle_filter,
+                (mode, "title"): self._act_title,
+                (mode, "next_page"): self.next_page,
+                (mode, "prev_page"): self.prev_page,
+                (mode, "open"): self._act_open,
+                (mode, "fav_item"): self._act_fav_item,
+            })
+        return actions
+
+    def _act_quit(self) -> None:
+        self.exit_requested = True
+
+    def _act_help(self) -> None:
+        self.mode = "HELP" if self.mode != "HELP" else ("FILES" if self.files else "RESULTS")
+        self.focus = "MENU"
+        self.menu_idx = 0
+        self.status = "Help" if self.mode == "HELP" else "Back"
 
-        if action == "back":
-            if self.mode == "FILES":
-                self.mode = "RESULTS"
-                self.focus = "LIST"
-                self.status = "Back to results"
-                return
-            if self.mode == "HELP":
-                self.mode = "FILES" if self.files else "RESULTS"
-                self.focus = "LIST"
-                self.status = "Back"
-                return
-            if self.mode == "FAVS":
-                self.mode = "FILES" if self.files else "RESULTS"
-                self.focus = "LIST"
-                self.status = "Back"
-                return
+    def _act_favs(self) -> None:
+        self.mode = "FAVS"
+        self.focus = "LIST"
+        self.menu_idx = 0
+        self.favs_idx = 0
+        if self.favs_tab not in _FAVS_TAB_NEXT:
+            self.favs_tab = "ITEMS"
+        self.status = "Favorites. Use Tab for menu, or arrows for list."
 
-        if self.mode in ("RESULTS", "SEARCH"):
-            if action == "search":
-                s = self.prompt("Search: ", self.query_text)
-                if s is not None:
-                    self.query_text = s
-                    self.show_welcome = False
-                    self.do_search(reset_page=True)
-                return
-            if action == "filter":
-                self.cycle_filter()
-                return
-            if action == "title":
-                self.title_only = not self.title_only
-                self.status = "Search mode: title" if self.title_only else "Search mode: broad"
-                return
-            if action == "next_page":
-                self.next_page()
-                return
-            if action == "prev_page":
-                self.prev_page()
-                return
-            if action == "open":
-                self.show_welcome = False
-                self.load_files()
-                return
-            if action == "fav_item":
-                if not self.results:
-                    self.status = "No result selected."
-                    return
-                self.toggle_fav_item(self.results[self.sel_r])
-                return
+    def _act_license_gate(self) -> None:
+        self.enforce_license_gate = not self.enforce_license_gate
+        self.status = "License gate: ON (blocks unclear rights)" if self.enforce_license_gate else "License gate: OFF (warns only)"
 
-        if self.mode == "FILES":
-            visible = self.get_visible_files()
+    def _act_back_to_results(self) -> None:
+        self.mode = "RESULTS"
+        self.focus = "LIST"
+        self.status = "Back to results"
 
-            if action == "keyword":
-                s = self.prompt("Keyword (blank clears): ", self.file_kw)
-                if s is not None:
-                    self.file_kw = s.strip()
-                    self.sel_f = 0
-                    self.status = "Keyword updated"
-                return
+    def _act_back(self) -> None:
+        self.mode = "FILES" if self.files else "RESULTS"
+        self.focus = "LIST"
+        self.status = "Back"
 
-            if action == "bucket":
-                self.cycle_bucket()
-                return
+    def _act_search(self) -> None:
+        s = self.prompt("Search: ", self.query_text)
+        if s is not None:
+            self.query_text = s
+            self.show_welcome = False
+            self.do_search(reset_page=True)
 
-            if action == "preview":
-                self.set_preview_for_selected()
-                return
+    def _act_title(self) -> None:
+        self.title_only = not self.title_only
+        self.status = "Search mode: title" if self.title_only else "Search mode: broad"
 
-            if action == "folder":
-                self.set_preview_for_prefix()
-                return
+    def _act_open(self) -> None:
+        self.show_welcome = False
+        self.load_files()
 
-            if action == "item":
-                self.set_preview_for_item()
-                return
+    def _act_fav_item(self) -> None:
+        if not self.results:
+            self.status = "No result selected."
+            return
+        self.toggle_fav_item(self.results[self.sel_r])
 
-            if action == "download":
-                self.set_preview_for_selected()
-                return
+    def _act_keyword(self) -> None:
+        s = self.prompt("Keyword (blank clears): ", self.file_kw)
+        if s is not None:
+            self.file_kw = s.strip()
+            self.sel_f = 0
+            self.status = "Keyword updated"
 
-            if action == "fav_file":
-                item = self.results[self.sel_r] if self.results else None
-                if not item or not visible:
-                    self.status = "No file selected."
-                    return
-                idx = self.sel_f
-                if 0 <= idx < len(visible):
-                    self.toggle_fav_file(item, visible[idx])
-                else:
-                    self.status = "Bad selection."
-                return
+    def _act_fav_file(self) -> None:
+        item = self.results[self.sel_r] if self.results else None
+        visible = self.get_visible_files()
+        if not item or not visible:
+            self.status = "No file selected."
+            return
+        idx = self.sel_f
+        if 0 <= idx < len(visible):
+            self.toggle_fav_file(item, visible[idx])
+        else:
+            self.status = "Bad selection."
 
-        if self.mode == "PREVIEW_DL":
-            if action == "confirm_download":
-                self.perform_download_plan()
-                return
-            if action == "cancel_preview":
-                self.mode = "FILES"
-                self.focus = "LIST"
-                self.status = "Canceled."
-                return
+    def _act_cancel_preview(self) -> None:
+        self.mode = "FILES"
+        self.focus = "LIST"
+        self.status = "Canceled."
 
-        if self.mode == "FAVS":
-            if action == "tab":
-                order = ["ITEMS", "FILES", "FOLDERS"]
-                try:
-                    i = order.index(self.favs_tab)
-                except Exception:
-                    i = 0
-                self.favs_tab = order[(i + 1) % len(order)]
-                self.favs_idx = 0
-                self.status = f"Favorites tab: {self.favs_tab}"
-                return
+    def _act_favs_tab(self) -> None:
+        self.favs_tab = _FAVS_TAB_NEXT.get(self.favs_tab, FAVS_TABS[1])
+        self.favs_idx = 0
+        self.status = f"Favorites tab: {self.favs_tab}"
 
-            if action == "remove":
-                self.status = "Remove not implemented in this build."
-                return
+    def _act_favs_remove(self) -> None:
+        self.status = "Remove not implemented in this build."
 
-            if action == "primary":
-                self.status = "Primary not implemented in this build."
-                return
+    def _act_favs_primary(self) -> None:
+        self.status = "Primary not implemented in this build."
 
     # ---------- input loop ----------
+    def _take_repeats(self, ch: int) -> int:
+        # A held arrow key queues a run of the same code; take the whole run so the move is
+        # applied (and clamped) once. The first different key goes back for the loop to read.
+        n = 1
+        self.stdscr.timeout(0)
+        try:
+            nxt = self.stdscr.getch()
+            while nxt == ch:
+                n += 1
+                nxt = self.stdscr.getch()
+        finally:
+            self.stdscr.timeout(-1)
+        if nxt != -1:
+            curses.ungetch(nxt)
+        return n
+
     def loop(self) -> None:
         ensure_dirs()
         self.init_colors()
         curses.curs_set(0)
         self.stdscr.keypad(True)
 
+        self.status = "Checking for ia..."
+        self.render()
+        self.ia_present, self.ia_version = self._ia_check.result()
         if self.ia_present:
             self.status = f"Ready (ia: {self.ia_version}). Choose [Search]."
         else:
+            self.mode = "ERROR"
             self.status = self.ia_version
 
         while not self.exit_requested:
-            self.render()
-            ch = self.stdscr.getch()
+            wait_s = MIN_FRAME_S - (time.monotonic() - self._last_render)
+            if wait_s > 0:
+                # Too soon for another frame: keep taking keys, but only until the frame is due.
+                self.stdscr.timeout(max(1, int(wait_s * 1000)))
+                ch = self.stdscr.getch()
+                self.stdscr.timeout(-1)
+                if ch == -1:
+                    continue
+            else:
+                # Keys already typed ahead would make this frame stale at once; take them first.
+                self.stdscr.timeout(0)
+                ch = self.stdscr.getch()
+                self.stdscr.timeout(-1)
+                if ch == -1:
+                    self.render()
+                    ch = self.stdscr.getch()
 
             if ch in (ord("q"), ord("Q")):
                 if self.mode == "PREVIEW_DL":
@@ -1981,8 +2847,8 @@ class RetroWaveIA:
                 self.status = "Focus: MENU" if self.focus == "MENU" else "Focus: LIST"
                 continue
 
-            items = self.get_menu_items()
             if self.focus == "MENU":
+                items = self.get_menu_items()
                 if ch == curses.KEY_LEFT:
                     if items:
                         self.menu_idx = max(0, self.menu_idx - 1)
@@ -1993,7 +2859,7 @@ class RetroWaveIA:
                     continue
                 if ch in (10, 13, curses.KEY_ENTER):
                     if items and 0 <= self.menu_idx < len(items):
-                        _label, action = items[self.menu_idx]
+                        _pill, _plen, action = items[self.menu_idx]
                         self.activate_menu_action(action)
                     continue
 
@@ -2008,10 +2874,10 @@ class RetroWaveIA:
             if self.focus == "LIST":
                 if self.mode in ("RESULTS", "SEARCH"):
                     if ch == curses.KEY_UP and self.results:
-                        self.sel_r = max(0, self.sel_r - 1)
+                        self.sel_r = max(0, self.sel_r - self._take_repeats(ch))
                         continue
                     if ch == curses.KEY_DOWN and self.results:
-                        self.sel_r = min(len(self.results) - 1, self.sel_r + 1)
+                        self.sel_r = min(len(self.results) - 1, self.sel_r + self._take_repeats(ch))
                         continue
                     if ch in (10, 13, curses.KEY_ENTER):
                         self.show_welcome = False
@@ -2027,10 +2893,10 @@ class RetroWaveIA:
                 if self.mode == "FILES":
                     visible = self.get_visible_files()
                     if ch == curses.KEY_UP and visible:
-                        self.sel_f = max(0, self.sel_f - 1)
+                        self.sel_f = max(0, self.sel_f - self._take_repeats(ch))
                         continue
                     if ch == curses.KEY_DOWN and visible:
-                        self.sel_f = min(len(visible) - 1, self.sel_f + 1)
+                        self.sel_f = min(len(visible) - 1, self.sel_f + self._take_repeats(ch))
                         continue
                     if ch in (10, 13, curses.KEY_ENTER):
                         self.set_preview_for_selected()
@@ -2044,9 +2910,17 @@ class RetroWaveIA:
         # exit
 
 
+threading.Thread(target=_log_writer, name="ia-log", daemon=True).start()
+# Let queued lines reach the file before the interpreter tears the daemon thread down.
+atexit.register(_LOG_Q.join)
+
+
 def main(stdscr):
     app = RetroWaveIA(stdscr)
-    app.loop()
+    try:
+        app.loop()
+    finally:
+        app._meta_pool.shutdown()
 
 
 if __name__ == "__main__":